@@ -0,0 +1,79 @@
+"""
+Shared OpenAI clients for all agents.
+
+Agents share one client (and so one httpx connection pool) per API key, so
+TLS sessions and keep-alive connections to the OpenAI API are reused across
+the chart recommendation, cleaning and text-to-SQL agents.
+"""
+
+from importlib.util import find_spec
+from typing import Dict, Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+# Connection pool limits for the shared httpx clients
+HTTP_POOL_CONFIG = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+}
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# api_key -> shared client
+_clients: Dict[Optional[str], OpenAI] = {}
+_async_clients: Dict[Optional[str], AsyncOpenAI] = {}
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Return the shared OpenAI client for an API key, creating it on first use
+
+    Args:
+        api_key: OpenAI API key (defaults to OPENAI_API_KEY environment variable)
+
+    Returns:
+        OpenAI client backed by a pooled, keep-alive httpx client
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(**HTTP_POOL_CONFIG),
+        )
+        client = OpenAI(api_key=api_key, http_client=http_client)
+        _clients[api_key] = client
+    return client
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Return the shared AsyncOpenAI client for an API key, creating it on first use
+
+    Args:
+        api_key: OpenAI API key (defaults to OPENAI_API_KEY environment variable)
+
+    Returns:
+        AsyncOpenAI client backed by a pooled, keep-alive httpx.AsyncClient
+    """
+    client = _async_clients.get(api_key)
+    if client is None:
+        http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(**HTTP_POOL_CONFIG),
+        )
+        client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        _async_clients[api_key] = client
+    return client
+
+
+async def close_openai_clients():
+    """Close all shared clients and their connection pools (call on shutdown)"""
+    for client in _async_clients.values():
+        await client.close()
+    _async_clients.clear()
+
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
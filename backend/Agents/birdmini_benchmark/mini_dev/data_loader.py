@@ -1,51 +1,109 @@
 import json
+import mmap
 import sqlite3
 import os
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it iter_examples loads the whole file
+    ijson = None
 
 class BIRDDataLoader:
     def __init__(self, data_path):
         self.data_path = data_path
-        self.examples = self.load_data()
+        self._examples = None
+        self._stats_cache = None
+        self._by_difficulty = None
+
+    @property
+    def examples(self):
+        # Materialized on first access so stats-only callers never hold the full list
+        if self._examples is None:
+            self._examples = self.load_data()
+        return self._examples
+
+    @examples.setter
+    def examples(self, value):
+        self._examples = value
+        self._stats_cache = None
+        self._by_difficulty = None
 
     def load_data(self):
+        if orjson is not None:
+            # Parse straight from the mapped file instead of copying it into a bytes object
+            with open(self.data_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
         with open(self.data_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         return data
 
+    def iter_examples(self):
+        """Yield examples one at a time without materializing the whole file"""
+        if self._examples is not None or ijson is None:
+            yield from self.examples
+            return
+
+        with open(self.data_path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+
     def get_example(self, idx):
         return self.examples[idx]
 
+    def get_examples_by_difficulty(self, difficulty):
+        """Return the examples of one difficulty, using a precomputed index"""
+        if self._by_difficulty is None:
+            by_difficulty = {}
+            for idx, ex in enumerate(self.examples):
+                by_difficulty.setdefault(ex.get('difficulty', 'unknown'), []).append(idx)
+            self._by_difficulty = by_difficulty
+        return [self.examples[idx] for idx in self._by_difficulty.get(difficulty, [])]
+
     def get_stats(self):
-        total = len(self.examples)
-        db_ids = set(ex['db_id'] for ex in self.examples)
-        difficulties = {}
-        for ex in self.examples:
-            diff = ex.get('difficulty', 'unknown')
-            difficulties[diff] = difficulties.get(diff, 0) + 1
-
-        return {
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        total = 0
+        db_ids = set()
+        difficulties = Counter()
+        for ex in self.iter_examples():
+            total += 1
+            db_ids.add(ex['db_id'])
+            difficulties[ex.get('difficulty', 'unknown')] += 1
+
+        self._stats_cache = {
             'total_examples': total,
             'unique_databases': len(db_ids),
             'databases': list(db_ids),
-            'difficulty_distribution': difficulties
+            'difficulty_distribution': dict(difficulties)
         }
+        return self._stats_cache
+
+if __name__ == "__main__":
+    # Load the data
+    loader = BIRDDataLoader('data/bird_mini_dev/data/mini_dev_sqlite-00000-of-00001.json')
+
+    # Print statistics
+    stats = loader.get_stats()
+    print("Dataset Statistics:")
+    print(f"  Total Examples: {stats['total_examples']}")
+    print(f"  Unique Databases: {stats['unique_databases']}")
+    print(f"  Difficulty Distribution: {stats['difficulty_distribution']}")
 
-# Load the data
-loader = BIRDDataLoader('data/bird_mini_dev/data/mini_dev_sqlite-00000-of-00001.json')
-
-# Print statistics
-stats = loader.get_stats()
-print("Dataset Statistics:")
-print(f"  Total Examples: {stats['total_examples']}")
-print(f"  Unique Databases: {stats['unique_databases']}")
-print(f"  Difficulty Distribution: {stats['difficulty_distribution']}")
-
-# Show first 3 examples
-print("\nFirst 3 Examples:")
-for i in range(3):
-    ex = loader.get_example(i)
-    print(f"\nExample {i+1}:")
-    print(f"  Question: {ex['question']}")
-    print(f"  Database: {ex['db_id']}")
-    print(f"  SQL: {ex['SQL']}")
-    print(f"  Difficulty: {ex.get('difficulty', 'N/A')}")
\ No newline at end of file
+    # Show first 3 examples
+    print("\nFirst 3 Examples:")
+    for i in range(3):
+        ex = loader.get_example(i)
+        print(f"\nExample {i+1}:")
+        print(f"  Question: {ex['question']}")
+        print(f"  Database: {ex['db_id']}")
+        print(f"  SQL: {ex['SQL']}")
+        print(f"  Difficulty: {ex.get('difficulty', 'N/A')}")
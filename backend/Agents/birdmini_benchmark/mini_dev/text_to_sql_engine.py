@@ -1,83 +1,294 @@
 import os
+import io
 import json
+import time
+import random
+import asyncio
 import sqlite3
-from openai import OpenAI
+from functools import cache
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError, APITimeoutError
 from dotenv import load_dotenv
 
 load_dotenv()
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+@cache
+def get_client():
+    """Shared OpenAI client, created on first use"""
+    return OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+@cache
+def get_async_client():
+    """Shared AsyncOpenAI client, created on first use"""
+    return AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+SQL_PROMPT_TEMPLATE = """You are an expert SQL query generator. Generate a SQLite query for the given question.
+
+Database Schema:
+{schema}
+
+Question: {question}
+{evidence}
+
+Generate ONLY the SQL query without any explanation. Use SQLite syntax."""
+
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError)
+MAX_ATTEMPTS = 3
+
+def _backoff(attempt, min_delay=1, max_delay=30):
+    """Randomized exponential backoff delay for the given (0-based) attempt"""
+    return random.uniform(min_delay, min(max_delay, min_delay * 2 ** (attempt + 1)))
+
+def create_with_retry(**kwargs):
+    """chat.completions.create with retries on transient errors"""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return get_client().chat.completions.create(**kwargs)
+        except RETRYABLE_ERRORS:
+            if attempt >= MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(_backoff(attempt))
+
+async def create_with_retry_async(**kwargs):
+    """Async chat.completions.create with retries on transient errors"""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return await get_async_client().chat.completions.create(**kwargs)
+        except RETRYABLE_ERRORS:
+            if attempt >= MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_backoff(attempt))
 
 class TextToSQLEngine:
-    def __init__(self, db_base_path="minidev/MINIDEV/dev_databases"):
+    def __init__(self, db_base_path="minidev/MINIDEV/dev_databases", use_batch_api=False):
         self.db_base_path = db_base_path
+        # Route bulk generation through the OpenAI Batch API (offline, half price)
+        self.use_batch_api = use_batch_api
+        # db_id -> (schema_version, schema string)
+        self._schema_cache = {}
+        # db_id -> open connection, reused across schema reads
+        self._conns = {}
 
-    def get_database_schema(self, db_id):
-        """Extract schema from database"""
-        db_path = os.path.join(self.db_base_path, db_id, f"{db_id}.sqlite")
+    def _get_connection(self, db_id):
+        """Return the pooled connection for a database, opening it on first use"""
+        conn = self._conns.get(db_id)
+        if conn is None:
+            db_path = os.path.join(self.db_base_path, db_id, f"{db_id}.sqlite")
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000;")
+            self._conns[db_id] = conn
+        return conn
 
-        conn = sqlite3.connect(db_path)
+    def close(self):
+        """Close all pooled connections"""
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+    def __del__(self):
+        self.close()
+
+    def get_database_schema(self, db_id):
+        """Extract schema from database (cached until PRAGMA schema_version changes)"""
+        conn = self._get_connection(db_id)
         cursor = conn.cursor()
 
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
+        cursor.execute("PRAGMA schema_version;")
+        schema_version = cursor.fetchone()[0]
+        cached = self._schema_cache.get(db_id)
+        if cached is not None and cached[0] == schema_version:
+            return cached[1]
 
-        schema_info = []
-        for table in tables:
-            table_name = table[0]
-            # Get columns for each table
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = cursor.fetchall()
+        # Get every table's columns in one query, in table then column order
+        cursor.execute(
+            "SELECT m.name, p.name, p.type "
+            "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+            "WHERE m.type='table' "
+            "ORDER BY m.rowid, p.cid;"
+        )
 
-            column_info = []
-            for col in columns:
-                column_info.append(f"{col[1]} {col[2]}")  # name type
+        tables = {}
+        for table_name, col_name, col_type in cursor.fetchall():
+            tables.setdefault(table_name, []).append(f"{col_name} {col_type}")
 
-            schema_info.append(f"Table {table_name}: {', '.join(column_info)}")
+        schema_info = [
+            f"Table {table_name}: {', '.join(column_info)}"
+            for table_name, column_info in tables.items()
+        ]
+
+        schema = "\n".join(schema_info)
+        self._schema_cache[db_id] = (schema_version, schema)
+        return schema
+
+    def _build_messages(self, question, db_id, evidence=None):
+        """Build the chat messages for a single question"""
+        schema = self.get_database_schema(db_id)
 
-        conn.close()
-        return "\n".join(schema_info)
+        evidence_line = f"\nAdditional Context: {evidence}" if evidence else ""
+        prompt = SQL_PROMPT_TEMPLATE.format(schema=schema, question=question, evidence=evidence_line)
+
+        return [
+            {"role": "system", "content": "You are an expert SQL generator. Return only valid SQLite queries."},
+            {"role": "user", "content": prompt}
+        ]
 
     def generate_sql(self, question, db_id, evidence=None):
         """Generate SQL using GPT-4o"""
-        schema = self.get_database_schema(db_id)
+        response = create_with_retry(
+            model="gpt-4o-2024-08-06",
+            messages=self._build_messages(question, db_id, evidence),
+            temperature=0,
+            max_tokens=500
+        )
 
-        prompt = f"""You are an expert SQL query generator. Generate a SQLite query for the given question.
+        return response.choices[0].message.content.strip()
 
-Database Schema:
-{schema}
+    def generate_sql_multi(self, items):
+        """Generate SQL for several (question, db_id, evidence) items in one request.
 
-Question: {question}
-"""
+        Packs the questions into a single chat completion to save requests per
+        minute when rate-limited by RPM rather than TPM. Items the model does
+        not answer are regenerated individually with generate_sql.
+        """
+        schemas = {}
+        for _, db_id, _ in items:
+            if db_id not in schemas:
+                schemas[db_id] = self.get_database_schema(db_id)
 
-        if evidence:
-            prompt += f"\nAdditional Context: {evidence}"
+        sections = [f"Database {db_id} Schema:\n{schema}" for db_id, schema in schemas.items()]
+        for idx, (question, db_id, evidence) in enumerate(items):
+            section = f"Question {idx + 1} (database {db_id}): {question}"
+            if evidence:
+                section += f"\nAdditional Context: {evidence}"
+            sections.append(section)
 
-        prompt += "\n\nGenerate ONLY the SQL query without any explanation. Use SQLite syntax."
+        prompt = (
+            f"You are an expert SQL query generator. Generate a SQLite query for each of the following "
+            f"{len(items)} questions.\n\n" + "\n\n".join(sections) +
+            f'\n\nRespond with a JSON object {{"queries": [...]}} containing exactly {len(items)} SQL strings, '
+            f"in question order. Use SQLite syntax."
+        )
 
-        response = client.chat.completions.create(
+        response = create_with_retry(
             model="gpt-4o-2024-08-06",
             messages=[
                 {"role": "system", "content": "You are an expert SQL generator. Return only valid SQLite queries."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0,
+            max_tokens=500 * len(items),
+            response_format={"type": "json_object"}
+        )
+
+        try:
+            queries = json.loads(response.choices[0].message.content).get("queries", [])
+        except (json.JSONDecodeError, AttributeError):
+            queries = []
+
+        results = []
+        for idx, (question, db_id, evidence) in enumerate(items):
+            if idx < len(queries) and isinstance(queries[idx], str) and queries[idx].strip():
+                results.append(queries[idx].strip())
+            else:
+                results.append(self.generate_sql(question, db_id, evidence))
+        return results
+
+    async def generate_sql_async(self, question, db_id, evidence=None):
+        """Async variant of generate_sql"""
+        response = await create_with_retry_async(
+            model="gpt-4o-2024-08-06",
+            messages=self._build_messages(question, db_id, evidence),
+            temperature=0,
             max_tokens=500
         )
 
         return response.choices[0].message.content.strip()
 
+    async def generate_many(self, examples, concurrency=20):
+        """Generate SQL for many benchmark examples with bounded concurrency.
+
+        Results are returned in the same order as examples.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(ex):
+            async with semaphore:
+                return await self.generate_sql_async(ex['question'], ex['db_id'], ex.get('evidence'))
+
+        return await asyncio.gather(*(run(ex) for ex in examples))
+
+    def generate_sql_batch(self, examples, poll_interval=30):
+        """Generate SQL for many examples through the OpenAI Batch API.
+
+        Blocks until the batch finishes and returns SQL strings in the same
+        order as examples (None for requests that failed).
+        """
+        lines = []
+        for idx, ex in enumerate(examples):
+            lines.append(json.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-2024-08-06",
+                    "messages": self._build_messages(ex['question'], ex['db_id'], ex.get('evidence')),
+                    "temperature": 0,
+                    "max_tokens": 500
+                }
+            }))
+
+        client = get_client()
+        batch_file = client.files.create(
+            file=("benchmark_batch.jsonl", io.BytesIO("\n".join(lines).encode('utf-8'))),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            print(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        results = [None] * len(examples)
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[int(record["custom_id"])] = content.strip()
+
+        return results
+
+    def generate_all(self, examples, concurrency=20):
+        """Generate SQL for all examples, via the Batch API when enabled"""
+        if self.use_batch_api:
+            return self.generate_sql_batch(examples)
+        return asyncio.run(self.generate_many(examples, concurrency=concurrency))
+
 # Test it
 if __name__ == "__main__":
-    engine = TextToSQLEngine()
+    from data_loader import BIRDDataLoader
 
-    # Test with first example from dataset
-    question = "What is the ratio of customers who pay in EUR against customers who pay in CZK?"
-    db_id = "debit_card_specializing"
+    engine = TextToSQLEngine()
+    loader = BIRDDataLoader('data/bird_mini_dev/data/mini_dev_sqlite-00000-of-00001.json')
 
-    print(f"Question: {question}")
-    print(f"Database: {db_id}")
-    print("\nGenerating SQL...")
+    # Test with the first examples from dataset
+    examples = loader.examples[:5]
+    print(f"Generating SQL for {len(examples)} examples...")
 
-    sql = engine.generate_sql(question, db_id)
-    print(f"\nGenerated SQL:\n{sql}")
\ No newline at end of file
+    results = engine.generate_all(examples)
+    for ex, sql in zip(examples, results):
+        print(f"\nQuestion: {ex['question']}")
+        print(f"Database: {ex['db_id']}")
+        print(f"Generated SQL:\n{sql}")
@@ -2,7 +2,7 @@
 Chart Recommendation Agent package.
 """
 
-from .agent import chart_rec_agent, ChartRecAgent
+from .agent import get_chart_rec_agent, ChartRecAgent
 from .models import ChartRecommendation, VisualizationResponse
 
-__all__ = ["chart_rec_agent", "ChartRecAgent", "ChartRecommendation", "VisualizationResponse"]
+__all__ = ["get_chart_rec_agent", "ChartRecAgent", "ChartRecommendation", "VisualizationResponse"]
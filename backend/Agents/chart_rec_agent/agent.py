@@ -2,6 +2,7 @@
 Main orchestrator for the Chart Recommendation agent.
 """
 
+from functools import cache
 from typing import List, Dict, Any, Optional
 from .models import VisualizationResponse
 from .openai_client import ChartRecOpenAIClient
@@ -45,5 +46,8 @@ class ChartRecAgent:
         )
 
 
-# Global instance
-chart_rec_agent = ChartRecAgent()
+# Shared instance, created on first use so importing the package does not build an OpenAI client
+@cache
+def get_chart_rec_agent() -> ChartRecAgent:
+    """Return the shared ChartRecAgent, creating it on first call"""
+    return ChartRecAgent()
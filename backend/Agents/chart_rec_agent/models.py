@@ -3,11 +3,13 @@ Pydantic models for the Chart Recommendation agent.
 """
 
 from typing import List, Optional, Any, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ChartRecommendation(BaseModel):
     """A single chart recommendation"""
+    model_config = ConfigDict(frozen=True)
+
     chart_type: str  # e.g., "bar", "line", "pie", "scatter"
     title: str
     description: str
@@ -21,5 +23,7 @@ class ChartRecommendation(BaseModel):
 
 class VisualizationResponse(BaseModel):
     """Response from the Chart Recommendation agent"""
+    model_config = ConfigDict(frozen=True)
+
     recommendations: List[ChartRecommendation]
     summary: str
@@ -3,12 +3,50 @@ OpenAI client for the Chart Recommendation agent.
 """
 
 import os
-import json
+import re
+import time
+import random
+import hashlib
+import orjson
 import openai
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from .._openai_shared import get_openai_client
 from .models import VisualizationResponse, ChartRecommendation
 from .prompts import CHART_REC_SYSTEM_PROMPT, CHART_REC_USER_PROMPT_TEMPLATE
 
+# Markdown code-fence stripping for the JSON-mode fallback
+_FENCE_START_RE = re.compile(r'^```(?:json)?\s*')
+_FENCE_END_RE = re.compile(r'\s*```$')
+
+# Transient errors worth retrying
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+
+RETRY_CONFIG = {
+    "max_attempts": 3,
+    "min_delay": 1,   # seconds
+    "max_delay": 30,  # seconds
+}
+
+RESPONSE_CACHE_CONFIG = {
+    "max_entries": 256,
+    "max_temperature": 0.5,  # Above this, responses vary too much to reuse
+}
+
+
+@lru_cache(maxsize=256)
+def _format_data_sections(columns_key: Tuple[Tuple[str, str], ...], sample_json: bytes) -> Tuple[str, str]:
+    """
+    Format the columns and sample-data prompt sections.
+
+    Cached on (columns, indented sample JSON) so re-analyzing the same result
+    (e.g. switching chart type) skips the join and the decode.
+    """
+    cols_str = "\\n".join([f"- {name} ({col_type})" for name, col_type in columns_key])
+    return cols_str, sample_json.decode()
+
+
 class ChartRecOpenAIClient:
     """Client for interacting with OpenAI for chart recommendations"""
 
@@ -18,7 +56,103 @@ class ChartRecOpenAIClient:
         if not self.api_key:
             print("[WARNING] OPENAI_API_KEY not found in environment")
         
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+        self.temperature = 0.2
+
+        # blake2b(model + prompt) -> VisualizationResponse, least recently used first
+        self._resp_cache: "OrderedDict[str, VisualizationResponse]" = OrderedDict()
+
+    def _call_with_retry(self, func, *args, **kwargs):
+        """
+        Call OpenAI API, retrying transient failures with randomized exponential backoff
+        """
+        max_attempts = RETRY_CONFIG["max_attempts"]
+
+        for attempt in range(max_attempts):
+            try:
+                return func(*args, **kwargs)
+
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_attempts - 1:
+                    print(f"[WARNING] OpenAI call failed after {max_attempts} attempts: {type(e).__name__}")
+                    raise
+
+                backoff = random.uniform(
+                    RETRY_CONFIG["min_delay"],
+                    min(RETRY_CONFIG["max_delay"], RETRY_CONFIG["min_delay"] * 2 ** (attempt + 1))
+                )
+                print(f"[WARNING] {type(e).__name__} (attempt {attempt + 1}/{max_attempts}). "
+                      f"Waiting {backoff:.1f}s before retry...")
+                time.sleep(backoff)
+
+    def _structured_parse_method(self):
+        """
+        Return the SDK's structured-output parse method, or None if it has none
+
+        chat.completions.parse only exists on recent openai releases; from 1.40
+        it is available as beta.chat.completions.parse, and older SDKs have
+        neither (JSON mode is used instead).
+        """
+        try:
+            return self.client.chat.completions.parse
+        except AttributeError:
+            pass
+        try:
+            return self.client.beta.chat.completions.parse
+        except AttributeError:
+            return None
+
+    def _request_recommendations(self, user_prompt: str) -> Optional[VisualizationResponse]:
+        """
+        Send the chart recommendation prompt to GPT and parse the response
+
+        Returns:
+            Parsed VisualizationResponse, or None if GPT returned empty content
+        """
+        messages = [
+            {"role": "system", "content": CHART_REC_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        # Prefer structured outputs so the response is validated against the schema
+        completions_parse = self._structured_parse_method()
+        if completions_parse is not None:
+            try:
+                response = self._call_with_retry(
+                    completions_parse,
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    response_format=VisualizationResponse
+                )
+                parsed = response.choices[0].message.parsed
+                if parsed is not None:
+                    return parsed
+                print("[WARNING] Structured output returned no parsed result, falling back to JSON mode")
+            except openai.BadRequestError as e:
+                print(f"[WARNING] Structured outputs unavailable for {self.model}, falling back to JSON mode: {e}")
+
+        response = self._call_with_retry(
+            self.client.chat.completions.create,
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            response_format={"type": "json_object"}
+        )
+
+        content = response.choices[0].message.content
+        if not content:
+            return None
+
+        # Handle potential markdown code blocks
+        content = content.strip()
+        if content.startswith("```"):
+            content = _FENCE_START_RE.sub('', content)
+            content = _FENCE_END_RE.sub('', content)
+
+        data = orjson.loads(content)
+
+        return VisualizationResponse(**data)
 
     def recommend_charts(
         self,
@@ -32,11 +166,11 @@ class ChartRecOpenAIClient:
         Get chart recommendations from GPT
         """
         try:
-            # Format columns info
-            cols_str = "\\n".join([f"- {c['name']} ({c['type']})" for c in columns_info])
-
-            # Format sample data
-            sample_str = json.dumps(sample_data[:5], indent=2)
+            # Format columns info and sample data
+            cols_str, sample_str = _format_data_sections(
+                tuple((c['name'], c['type']) for c in columns_info),
+                orjson.dumps(sample_data[:5], option=orjson.OPT_INDENT_2)
+            )
 
             user_prompt = CHART_REC_USER_PROMPT_TEMPLATE.format(
                 sql_query=sql_query,
@@ -52,30 +186,32 @@ CHART TYPE PREFERENCE:
 The user has specifically requested a '{preferred_chart_type}' chart. You MUST use '{preferred_chart_type}' as the chart_type.
 Configure x_axis, y_axis, and color_by optimally for this chart type with this data."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": CHART_REC_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2
+            # Identical requests (e.g. dashboard refresh) reuse the previous response
+            use_cache = (
+                not preferred_chart_type
+                and self.temperature <= RESPONSE_CACHE_CONFIG["max_temperature"]
             )
+            if use_cache:
+                cache_key = hashlib.blake2b(
+                    f"{self.model}\0{user_prompt}".encode("utf-8"), digest_size=16
+                ).hexdigest()
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None:
+                    self._resp_cache.move_to_end(cache_key)
+                    print("[CHART-REC] Returning cached recommendation")
+                    return cached
 
-            content = response.choices[0].message.content
-            if not content:
+            result = self._request_recommendations(user_prompt)
+            if result is None:
                 print("[WARNING] GPT returned empty content for chart recommendation")
                 return VisualizationResponse(recommendations=[], summary="Empty response from AI")
 
-            # Handle potential markdown code blocks
-            import re
-            content = content.strip()
-            if content.startswith("```"):
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
+            if use_cache:
+                self._resp_cache[cache_key] = result
+                if len(self._resp_cache) > RESPONSE_CACHE_CONFIG["max_entries"]:
+                    self._resp_cache.popitem(last=False)
 
-            data = json.loads(content)
-            
-            return VisualizationResponse(**data)
+            return result
 
         except Exception as e:
             print(f"[ERROR] Chart recommendation failed: {e}")
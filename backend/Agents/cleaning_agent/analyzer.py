@@ -2,11 +2,17 @@
 Main CleaningAgent orchestrator class.
 """
 
+import asyncio
+import hashlib
+import orjson
 import pandas as pd
-from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
 from .models import (
     Problem,
+    ProblemType,
     ProblemWithOptions,
     SessionState,
     OperationResult,
@@ -19,9 +25,156 @@ from .config import (
     DATE_FORMAT_OPTIONS,
     BOOLEAN_FORMAT_OPTIONS,
     CASE_FORMAT_OPTIONS,
-    DEFAULT_PROS_CONS
+    DEFAULT_PROS_CONS,
+    RECOMMENDATION_CONFIG,
+    DATASET_CACHE_CONFIG
 )
-from .state_manager import session_manager
+from .state_manager import session_manager, read_dataset_csv
+
+# Map operation function names to DEFAULT_PROS_CONS keys
+OPERATION_TO_PROSCONS_KEY = MappingProxyType({
+    "drop_columns": "drop_columns",
+    "drop_missing_rows": "drop_rows",
+    "fill_with_mean": "fill_mean",
+    "fill_with_median": "fill_median",
+    "fill_with_mode": "fill_mode",
+    "fill_with_value": "fill_with_value",
+    "remove_outliers": "remove_outliers",
+    "cap_outliers": "cap_outliers",
+    "drop_duplicate_rows": "drop_duplicates_first",
+    "drop_duplicate_columns": "drop_duplicate_columns",
+    "no_operation": "keep_missing",  # Default when no problem-specific key applies
+})
+
+def _recommendation_signature(
+    problem: Problem,
+    options: List,
+    dataset_stats: DatasetStats,
+    dataset_name: str
+) -> str:
+    """
+    Hash the parts of a recommendation request that decide GPT's answer.
+
+    Percentages are bucketed and counts are left out, so e.g. the same column
+    before and after a small fill shares a signature. Column names and example
+    values stay in: GPT's reason names the column and judges its values, so it
+    must not be reused for a different column.
+
+    Args:
+        problem: Problem object
+        options: Options generated for the problem
+        dataset_stats: Dataset stats sent with the prompt
+        dataset_name: Dataset name sent with the prompt
+
+    Returns:
+        Hex digest signature
+    """
+    bucket = RECOMMENDATION_CONFIG.get("signature_percentage_bucket", 5)
+
+    metadata = {}
+    for key, value in problem.metadata.items():
+        if key.endswith("_percentage"):
+            metadata[key] = round(float(value) / bucket)
+        elif key in ("format_type", "is_identifier"):
+            metadata[key] = value
+        elif key == "detected_formats":
+            metadata[key] = sorted(value)
+        elif "example" in key or "sample" in key:
+            metadata[key] = value
+
+    payload = {
+        "dataset": [dataset_name, dataset_stats.row_count, dataset_stats.column_count],
+        "problem_type": problem.problem_type.value,
+        "columns": problem.affected_columns,
+        "options": [[opt.operation_type, opt.option_name] for opt in options],
+        "metadata": metadata,
+    }
+    return hashlib.blake2b(
+        orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+
+def _options_fingerprint(options: List) -> tuple:
+    """
+    Identify an option list by what each (positional) option id does.
+
+    Args:
+        options: CleaningOption objects
+
+    Returns:
+        Tuple of (option_id, operation_type, option_name) per option
+    """
+    return tuple((opt.option_id, opt.operation_type, opt.option_name) for opt in options)
+
+
+# Shared read-only impact_metrics for options without dynamic metrics
+EMPTY_IMPACT_METRICS = MappingProxyType({})
+
+def _make_option_builder(problem_type_key: str, op_config: Dict[str, Any]):
+    """
+    Specialize one CLEANING_OPERATIONS entry into an option template builder.
+
+    Args:
+        problem_type_key: Problem type the operation belongs to
+        op_config: Operation config from CLEANING_OPERATIONS
+
+    Returns:
+        Function taking a Problem and returning its option template dict, or
+        None if the option doesn't apply to that problem
+    """
+    name = op_config["name"]
+    operation_type = op_config["function"]
+    base_parameters = op_config["parameters"]
+    description = op_config["description"]
+    requires_input = op_config.get("requires_input", False)
+    min_missing_percentage = op_config.get("min_missing_percentage")
+    fills_columns = "columns" in base_parameters
+    is_duplicate_columns = problem_type_key == "duplicates_columns"
+
+    def build(problem: Problem) -> Optional[Dict[str, Any]]:
+        # Only offer this option when the missing percentage is high enough
+        if (min_missing_percentage is not None
+                and problem.metadata.get("null_percentage", 0) < min_missing_percentage):
+            return None
+
+        # Config parameters are shared until columns need filling in
+        # (CleaningOption copies the dict when it validates it)
+        parameters = base_parameters
+        if fills_columns:
+            # Duplicate columns remove the duplicates; others act on the affected columns
+            if is_duplicate_columns:
+                parameters = {**base_parameters, "columns": problem.metadata.get("columns_to_remove", [])}
+            elif problem.affected_columns:
+                parameters = {**base_parameters, "columns": problem.affected_columns}
+
+        return {
+            "name": name,
+            "operation_type": operation_type,
+            "parameters": parameters,
+            "description": description,
+            "requires_input": requires_input
+        }
+
+    return build
+
+
+# problem_type -> option template builders, built once from the static CLEANING_OPERATIONS
+OPTION_BUILDERS = MappingProxyType({
+    problem_type_key: tuple(
+        _make_option_builder(problem_type_key, op_config)
+        for op_config in operation_templates.values()
+    )
+    for problem_type_key, operation_templates in CLEANING_OPERATIONS.items()
+})
+
+# Problem-specific DEFAULT_PROS_CONS keys, checked before OPERATION_TO_PROSCONS_KEY
+PROBLEM_PROSCONS_KEY = MappingProxyType({
+    ("no_operation", ProblemType.MISSING_VALUES): "keep_missing",
+    ("no_operation", ProblemType.OUTLIERS): "keep_outliers",
+    ("no_operation", ProblemType.HIGH_CARDINALITY): "keep_high_cardinality",
+    ("drop_columns", ProblemType.HIGH_CARDINALITY): "drop_high_cardinality",
+})
 
 
 class CleaningAgent:
@@ -52,10 +205,70 @@ class CleaningAgent:
         else:
             self.openai_client = None
 
-    def start_session(
+        # file hash (+ dtype) -> (DataFrame, problems), least recently used first.
+        # Cleaning operations always return a new DataFrame, so sessions can share these.
+        self._dataset_cache: "OrderedDict[str, Tuple[pd.DataFrame, List[Problem]]]" = OrderedDict()
+
+        # problem signature -> (recommended option index, reason), least recently used first
+        self._recommendation_by_signature: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+
+        # Running Batch API jobs (held so the tasks aren't garbage collected)
+        self._batch_tasks: "set[asyncio.Task]" = set()
+
+    def _dataset_cache_key(
+        self,
+        temp_file_path: str,
+        dtype: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Hash a dataset file's contents (and read options) for the dataset cache.
+
+        Args:
+            temp_file_path: Path to the CSV file
+            dtype: dtype mapping the file will be read with
+            columns: Columns the file will be read with
+
+        Returns:
+            Hex digest identifying the parsed dataset
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        chunk_size = DATASET_CACHE_CONFIG["hash_chunk_size"]
+        with open(temp_file_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                digest.update(chunk)
+        if dtype:
+            digest.update(repr(sorted((str(k), str(v)) for k, v in dtype.items())).encode("utf-8"))
+        if columns is not None:
+            digest.update(repr(list(columns)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_and_detect(
+        self,
+        temp_file_path: str,
+        dtype: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[pd.DataFrame, List[Problem]]:
+        """
+        Read a dataset CSV and detect its problems (blocking; run in a worker thread).
+
+        Args:
+            temp_file_path: Path to the CSV file
+            dtype: Optional column -> dtype mapping passed to the CSV reader
+            columns: Optional list of columns to load
+
+        Returns:
+            Tuple of (DataFrame, detected problems)
+        """
+        df = read_dataset_csv(temp_file_path, dtype=dtype, columns=columns)
+        return df, detect_all_problems(df)
+
+    async def start_session(
         self,
         temp_file_path: str,
-        dataset_name: str
+        dataset_name: str,
+        dtype: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
     ) -> StartSessionResponse:
         """
         Start a new cleaning session.
@@ -63,23 +276,40 @@ class CleaningAgent:
         Args:
             temp_file_path: Path to the temporary CSV file
             dataset_name: Name of the dataset
+            dtype: Optional column -> dtype mapping passed to the CSV reader
+            columns: Optional list of columns to clean; other columns are not
+                parsed and are not kept in the cleaned file
 
         Returns:
             StartSessionResponse with session info and first problem
         """
-        # Store dataset name for later use in recommendations
-        self._current_dataset_name = dataset_name
-
-        # Load DataFrame to detect problems
-        df = pd.read_csv(temp_file_path)
+        # Reuse the parsed DataFrame and detected problems if this file was seen before.
+        # File reading, parsing and detection run in worker threads so they don't block the event loop.
+        cache_key = await asyncio.to_thread(self._dataset_cache_key, temp_file_path, dtype, columns)
+        cached = self._dataset_cache.get(cache_key)
+        if cached is not None:
+            self._dataset_cache.move_to_end(cache_key)
+            df, problems = cached
+            problems = list(problems)
+        else:
+            # Load DataFrame and detect all problems
+            df, problems = await asyncio.to_thread(self._load_and_detect, temp_file_path, dtype, columns)
 
-        # Detect all problems
-        problems = detect_all_problems(df)
+            self._dataset_cache[cache_key] = (df, list(problems))
+            if len(self._dataset_cache) > DATASET_CACHE_CONFIG["max_entries"]:
+                self._dataset_cache.popitem(last=False)
 
-        # Create session
-        session_id = session_manager.create_session(temp_file_path, dataset_name, problems)
+        # Create session (reusing the parsed DataFrame instead of reading the file again)
+        session_id = session_manager.create_session(temp_file_path, dataset_name, problems, df=df)
         session = session_manager.get_session(session_id)
 
+        # Recommend for every problem in one GPT call instead of one call per problem,
+        # or hand them all to the Batch API when realtime answers aren't needed
+        if RECOMMENDATION_CONFIG.get("mode", "realtime") == "batch":
+            self._schedule_batch(session_id)
+        elif len(problems) > 1:
+            await self._precompute_recommendations(session)
+
         # Get session state
         session_state = session.to_session_state()
 
@@ -103,7 +333,7 @@ class CleaningAgent:
             summary = ": ".join([summary_parts[0], ", ".join(summary_parts[1:])]) + "."
 
             # Get first problem with options
-            first_problem = self.get_next_problem(session_id)
+            first_problem = await self.get_next_problem(session_id)
 
         return StartSessionResponse(
             session_id=session_id,
@@ -112,7 +342,7 @@ class CleaningAgent:
             summary=summary
         )
 
-    def get_next_problem(self, session_id: str, include_recommendation: bool = True) -> Optional[ProblemWithOptions]:
+    async def get_next_problem(self, session_id: str, include_recommendation: bool = True) -> Optional[ProblemWithOptions]:
         """
         Get the next problem with cleaning options.
 
@@ -140,7 +370,7 @@ class CleaningAgent:
             options = session.cached_options
         else:
             # Generate cleaning options without recommendation first
-            options, _ = self._generate_options_for_problem(
+            options, _ = await self._generate_options_for_problem(
                 current_problem, session.df, include_recommendation=False
             )
             # Cache the options for consistent option_ids
@@ -149,20 +379,34 @@ class CleaningAgent:
         # Handle recommendation separately using per-problem cache
         recommendation = None
         if include_recommendation:
-            # Check per-problem recommendation cache first
-            if problem_id in session.recommendation_cache:
-                recommendation = session.recommendation_cache[problem_id]
+            # Check per-problem recommendation cache first (entries made for other options are dropped)
+            recommendation = self._get_cached_recommendation(session, problem_id, options)
+            generate = False
+            if recommendation is not None:
+                pass
             elif session.cached_recommendation is not None:
                 recommendation = session.cached_recommendation
+            elif problem_id in session.pending_recommendations:
+                # Prefetch already in flight - wait for it instead of calling GPT again
+                prefetched = await session.pending_recommendations[problem_id]
+                recommendation = self._get_cached_recommendation(session, problem_id, options)
+                # A prefetch made before the last operation may have chosen between other options
+                generate = prefetched is not None and recommendation is None
+                session.cached_recommendation = recommendation
             else:
+                generate = True
+
+            if generate:
                 # Generate recommendation if not cached
-                _, recommendation = self._generate_options_for_problem(
-                    current_problem, session.df, include_recommendation=True
+                current_options, recommendation = await self._generate_options_for_problem(
+                    current_problem, session.df, include_recommendation=True,
+                    get_dataset_stats=session.get_current_stats,
+                    dataset_name=session.dataset_name
                 )
                 # Cache the recommendation both ways
                 session.cached_recommendation = recommendation
                 if recommendation:
-                    session.recommendation_cache[problem_id] = recommendation
+                    self._cache_recommendation(session, problem_id, current_options, recommendation)
 
         # Calculate addressed problem IDs for progress-based numbering
         addressed_problem_ids = {op.problem_id for op in session.operation_history}
@@ -182,9 +426,274 @@ class CleaningAgent:
             recommendation=recommendation
         )
 
+        # Start fetching the following problem's recommendation while the user reviews this one
+        if include_recommendation:
+            self._schedule_prefetch(session)
+
+        session.last_served = problem_with_options
         return problem_with_options
 
-    def apply_operation(
+    def _cache_recommendation(self, session, problem_id: str, options: List, recommendation) -> None:
+        """
+        Cache a problem's recommendation together with the options it chose from.
+
+        Args:
+            session: SessionData to update
+            problem_id: Problem the recommendation is for
+            options: Options GPT chose between
+            recommendation: GPTRecommendation
+        """
+        session.recommendation_cache[problem_id] = (_options_fingerprint(options), recommendation)
+
+    def _get_cached_recommendation(self, session, problem_id: str, options: List):
+        """
+        Return a problem's cached recommendation if it was made for these options.
+
+        Re-detection after an operation keeps a problem's id but can change its
+        options (e.g. "Drop column" only exists above a missing percentage), and
+        option ids are positional, so a recommendation made for the old options
+        may point at a different operation now. Such entries are discarded.
+
+        Args:
+            session: SessionData to look in
+            problem_id: Problem to look up
+            options: The problem's current options
+
+        Returns:
+            GPTRecommendation, or None if missing or stale
+        """
+        entry = session.recommendation_cache.get(problem_id)
+        if entry is None:
+            return None
+
+        fingerprint, recommendation = entry
+        if fingerprint != _options_fingerprint(options):
+            print(f"[GPT] Discarding recommendation for {problem_id}: its options changed")
+            del session.recommendation_cache[problem_id]
+            return None
+        return recommendation
+
+    async def _collect_recommendation_inputs(self, session) -> Dict[str, List]:
+        """
+        Build options for every problem that GPT can choose between.
+
+        Args:
+            session: SessionData to collect problems from
+
+        Returns:
+            problem_id -> options, for problems with 2+ options
+        """
+        options_per_problem = {}
+        for problem in session.problems:
+            options, _ = await self._generate_options_for_problem(
+                problem, session.df, include_recommendation=False
+            )
+            if len(options) > 1:
+                options_per_problem[problem.problem_id] = options
+
+        return options_per_problem
+
+    def _store_recommendations(
+        self,
+        session,
+        recommendations: Dict[str, Tuple[str, str]],
+        options_per_problem: Dict[str, List]
+    ) -> None:
+        """
+        Put (recommended_option_id, reason) pairs into the session's recommendation cache.
+
+        Each entry remembers the options it was made for, so it is discarded
+        once an operation changes that problem's options.
+
+        Args:
+            session: SessionData to update
+            recommendations: Mapping of problem_id to (recommended_option_id, reason)
+            options_per_problem: Mapping of problem_id to the options GPT chose between
+        """
+        from .models import GPTRecommendation
+
+        for problem_id, (recommended_id, reason) in recommendations.items():
+            self._cache_recommendation(session, problem_id, options_per_problem[problem_id], GPTRecommendation(
+                recommended_option_id=recommended_id,
+                reason=reason
+            ))
+
+    async def _precompute_recommendations(self, session) -> None:
+        """
+        Fill the session's recommendation cache for all problems with one GPT call.
+
+        Problems left out of the response are then requested one call each,
+        concurrently; any still missing keep the per-problem path (prefetch or
+        on-demand generation).
+
+        Args:
+            session: Newly created SessionData
+        """
+        if not (self.enable_gpt_recommendations and self.openai_client
+                and RECOMMENDATION_CONFIG.get("bulk_enabled", True)):
+            return
+
+        try:
+            options_per_problem = await self._collect_recommendation_inputs(session)
+            if not options_per_problem:
+                return
+
+            # Reuse the first problem's options so get_next_problem doesn't rebuild them
+            first_problem_id = session.problems[0].problem_id
+            if first_problem_id in options_per_problem:
+                session.cached_options = options_per_problem[first_problem_id]
+
+            problems = [p for p in session.problems if p.problem_id in options_per_problem]
+            dataset_stats = session.get_current_stats()
+            recommendations = await self.openai_client.generate_recommendations_bulk(
+                problems=problems,
+                options_per_problem=options_per_problem,
+                dataset_stats=dataset_stats,
+                dataset_name=session.dataset_name
+            )
+            self._store_recommendations(session, recommendations, options_per_problem)
+
+            print(f"[GPT] Bulk recommendations: {len(recommendations)}/{len(options_per_problem)} problems")
+
+            # Problems the bulk call skipped (or all of them, if it failed) get
+            # their own requests, fanned out concurrently
+            missing = [p for p in problems if p.problem_id not in recommendations]
+            if missing and RECOMMENDATION_CONFIG.get("concurrent_fill", True):
+                filled = await self.openai_client.generate_recommendations_concurrent(
+                    problems=missing,
+                    options_per_problem=options_per_problem,
+                    dataset_stats=dataset_stats,
+                    dataset_name=session.dataset_name
+                )
+                self._store_recommendations(session, filled, options_per_problem)
+
+                print(f"[GPT] Concurrent recommendations: {len(filled)}/{len(missing)} problems")
+
+        except Exception as e:
+            # Fail silently - recommendations are generated per problem instead
+            print(f"[WARNING] Failed to precompute GPT recommendations: {e}")
+
+    async def precompute_recommendations_batch(self, session_id: str) -> int:
+        """
+        Generate recommendations for all remaining problems through the OpenAI Batch API.
+
+        Intended for scripted/CLI cleaning runs: the Batch API is half the cost of
+        regular calls but can take up to its completion window, so this should not
+        be awaited on an interactive request path.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Number of problems that received a recommendation
+        """
+        session = session_manager.get_session(session_id)
+        if not session:
+            raise ValueError(f"Session not found: {session_id}")
+
+        if not (self.enable_gpt_recommendations and self.openai_client):
+            return 0
+
+        options_per_problem = await self._collect_recommendation_inputs(session)
+
+        # Skip problems that already have a recommendation
+        pending = [
+            p for p in session.problems
+            if p.problem_id in options_per_problem and p.problem_id not in session.recommendation_cache
+        ]
+        if not pending:
+            return 0
+
+        recommendations = await self.openai_client.generate_recommendations_batch(
+            problems=pending,
+            options_per_problem=options_per_problem,
+            dataset_stats=session.get_current_stats(),
+            dataset_name=session.dataset_name
+        )
+        self._store_recommendations(session, recommendations, options_per_problem)
+
+        print(f"[GPT] Batch recommendations: {len(recommendations)}/{len(pending)} problems")
+        return len(recommendations)
+
+    def _schedule_batch(self, session_id: str) -> None:
+        """
+        Submit a session's recommendations to the Batch API in the background.
+
+        Problems reached before the batch completes still get per-problem
+        recommendations (prefetch or on-demand generation).
+
+        Args:
+            session_id: Session ID
+        """
+        if not (self.enable_gpt_recommendations and self.openai_client):
+            return
+
+        task = asyncio.create_task(self.precompute_recommendations_batch(session_id))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    def _schedule_prefetch(self, session) -> None:
+        """
+        Start a background GPT recommendation for the next unaddressed problem.
+
+        Args:
+            session: SessionData whose upcoming problem should be prefetched
+        """
+        if not (self.enable_gpt_recommendations and self.openai_client):
+            return
+
+        addressed_problem_ids = {op.problem_id for op in session.operation_history}
+        next_problem = next(
+            (p for p in session.problems[session.current_problem_index + 1:]
+             if p.problem_id not in addressed_problem_ids),
+            None
+        )
+        if next_problem is None:
+            return
+
+        problem_id = next_problem.problem_id
+        if problem_id in session.pending_recommendations:
+            return
+
+        session.pending_recommendations[problem_id] = asyncio.create_task(
+            self._prefetch_recommendation(session, next_problem)
+        )
+
+    async def _prefetch_recommendation(self, session, problem: Problem):
+        """
+        Generate and cache a recommendation for a problem in the background.
+
+        A cached recommendation is kept if it was made for the problem's current
+        options; otherwise (or if there is none) GPT is asked again.
+
+        Args:
+            session: SessionData the problem belongs to
+            problem: Problem to generate the recommendation for
+
+        Returns:
+            GPTRecommendation or None
+        """
+        try:
+            if problem.problem_id in session.recommendation_cache:
+                options, _ = await self._generate_options_for_problem(
+                    problem, session.df, include_recommendation=False
+                )
+                recommendation = self._get_cached_recommendation(session, problem.problem_id, options)
+                if recommendation is not None:
+                    return recommendation
+
+            options, recommendation = await self._generate_options_for_problem(
+                problem, session.df, include_recommendation=True,
+                get_dataset_stats=session.get_current_stats,
+                dataset_name=session.dataset_name
+            )
+            if recommendation:
+                self._cache_recommendation(session, problem.problem_id, options, recommendation)
+            return recommendation
+        finally:
+            session.pending_recommendations.pop(problem.problem_id, None)
+
+    async def apply_operation(
         self,
         session_id: str,
         option_id: str,
@@ -207,8 +716,11 @@ class CleaningAgent:
         # Get current problem
         current_problem = session.problems[session.current_problem_index]
 
-        # Find the selected option
-        current_problem_with_options = self.get_next_problem(session_id)
+        # Find the selected option in what the user was shown (options only if not served yet)
+        current_problem_with_options = session.last_served
+        if (current_problem_with_options is None
+                or current_problem_with_options.problem.problem_id != current_problem.problem_id):
+            current_problem_with_options = await self.get_next_problem(session_id, include_recommendation=False)
         selected_option = next(
             (opt for opt in current_problem_with_options.options if opt.option_id == option_id),
             None
@@ -246,7 +758,7 @@ class CleaningAgent:
             session_complete=False  # Will be determined on confirm
         )
 
-    def confirm_and_advance(self, session_id: str) -> OperationResult:
+    async def confirm_and_advance(self, session_id: str) -> OperationResult:
         """
         Confirm the pending operation and advance to the next problem.
         Called when user clicks "Confirm Changes".
@@ -273,7 +785,7 @@ class CleaningAgent:
         session_manager.update_problems_after_operation(session_id)
 
         # Get next problem WITH recommendation (this is when GPT is called)
-        next_problem = self.get_next_problem(session_id, include_recommendation=True)
+        next_problem = await self.get_next_problem(session_id, include_recommendation=True)
 
         # Determine if session is complete
         session_complete = next_problem is None
@@ -287,7 +799,7 @@ class CleaningAgent:
             session_complete=session_complete
         )
 
-    def undo_last(self, session_id: str) -> OperationResult:
+    async def undo_last(self, session_id: str) -> OperationResult:
         """
         Undo the last operation (used for "Discard" button).
 
@@ -330,7 +842,7 @@ class CleaningAgent:
         session_manager.update_problems_after_operation(session_id)
 
         # Get the problem (which should now be the previous one we undid)
-        next_problem = self.get_next_problem(session_id, include_recommendation=True)
+        next_problem = await self.get_next_problem(session_id, include_recommendation=True)
 
         return OperationResult(
             success=True,
@@ -357,7 +869,7 @@ class CleaningAgent:
 
         return session.to_session_state()
 
-    def get_current_recommendation(self, session_id: str) -> Optional[ProblemWithOptions]:
+    async def get_current_recommendation(self, session_id: str) -> Optional[ProblemWithOptions]:
         """
         Get the current problem with GPT recommendation.
         Called after user confirms to fetch recommendation for the current problem.
@@ -382,32 +894,40 @@ class CleaningAgent:
 
         # Check if we already have cached recommendation (per-problem cache first)
         if problem_id in session.recommendation_cache:
-            return self.get_next_problem(session_id, include_recommendation=True)
+            return await self.get_next_problem(session_id, include_recommendation=True)
+
+        # A prefetch is in flight - get_next_problem awaits it
+        if problem_id in session.pending_recommendations:
+            return await self.get_next_problem(session_id, include_recommendation=True)
 
         if session.cached_recommendation is not None:
             # Cache it per-problem too
-            session.recommendation_cache[problem_id] = session.cached_recommendation
-            return self.get_next_problem(session_id, include_recommendation=True)
+            self._cache_recommendation(session, problem_id, session.cached_options, session.cached_recommendation)
+            return await self.get_next_problem(session_id, include_recommendation=True)
 
         # Generate recommendation now
-        options, recommendation = self._generate_options_for_problem(
-            current_problem, session.df, include_recommendation=True
+        options, recommendation = await self._generate_options_for_problem(
+            current_problem, session.df, include_recommendation=True,
+            get_dataset_stats=session.get_current_stats,
+            dataset_name=session.dataset_name
         )
 
         # Update cache with recommendation
         session.cached_options = options
         session.cached_recommendation = recommendation
         if recommendation:
-            session.recommendation_cache[problem_id] = recommendation
+            self._cache_recommendation(session, problem_id, options, recommendation)
 
         # Return full problem with options and recommendation
-        return self.get_next_problem(session_id, include_recommendation=True)
+        return await self.get_next_problem(session_id, include_recommendation=True)
 
-    def _generate_options_for_problem(
+    async def _generate_options_for_problem(
         self,
         problem: Problem,
         df: pd.DataFrame,
-        include_recommendation: bool = True
+        include_recommendation: bool = True,
+        get_dataset_stats: Optional[Callable[[], DatasetStats]] = None,
+        dataset_name: Optional[str] = None
     ) -> Tuple[List, Any]:
         """
         Generate cleaning options for a problem with optional GPT recommendation.
@@ -416,6 +936,9 @@ class CleaningAgent:
             problem: Problem object
             df: Current DataFrame
             include_recommendation: Whether to include GPT recommendation (default True)
+            get_dataset_stats: Returns stats for df, only called if a recommendation is
+                requested (stats are computed from df if omitted)
+            dataset_name: Name of the session's dataset, sent with the recommendation request
 
         Returns:
             Tuple of (List of CleaningOption objects, Optional GPTRecommendation)
@@ -424,45 +947,21 @@ class CleaningAgent:
 
         # Special handling for format inconsistency - generate dynamic options
         if problem_type_key == "format_inconsistency":
-            return self._generate_format_inconsistency_options(problem, df, include_recommendation)
+            return await self._generate_format_inconsistency_options(
+                problem, df, include_recommendation, get_dataset_stats, dataset_name
+            )
 
-        # Get operation templates for this problem type
-        operation_templates = CLEANING_OPERATIONS.get(problem_type_key, {})
+        # Build option templates from the precompiled builders for this problem type
+        option_builders = OPTION_BUILDERS.get(problem_type_key, ())
 
-        if not operation_templates:
+        if not option_builders:
             return [], None
 
-        # Convert templates to list format for GPT-4
         template_list = []
-        for _, op_config in operation_templates.items():
-            # Check if this option should be included based on missing percentage
-            if "min_missing_percentage" in op_config:
-                # Get missing percentage from problem metadata
-                missing_percentage = problem.metadata.get("null_percentage", 0)
-                if missing_percentage < op_config["min_missing_percentage"]:
-                    # Skip this option if missing percentage is too low
-                    continue
-
-            template = {
-                "name": op_config["name"],
-                "operation_type": op_config["function"],
-                "parameters": op_config["parameters"].copy(),
-                "description": op_config["description"],
-                "requires_input": op_config.get("requires_input", False)
-            }
-
-            # Fill in affected columns for missing values and outliers
-            if problem.affected_columns:
-                if "columns" in template["parameters"]:
-                    template["parameters"]["columns"] = problem.affected_columns
-
-            # For duplicate columns, fill in columns to remove
-            if problem_type_key == "duplicates_columns":
-                columns_to_remove = problem.metadata.get("columns_to_remove", [])
-                if "columns" in template["parameters"]:
-                    template["parameters"]["columns"] = columns_to_remove
-
-            template_list.append(template)
+        for build in option_builders:
+            template = build(problem)
+            if template is not None:
+                template_list.append(template)
 
         # Generate options using static pros/cons from config
         options = self._create_static_options(template_list, problem)
@@ -470,44 +969,103 @@ class CleaningAgent:
         # Generate GPT recommendation if enabled and requested
         recommendation = None
         if include_recommendation and self.enable_gpt_recommendations and self.openai_client and len(options) > 1:
-            try:
-                from .models import GPTRecommendation, DatasetStats
-
-                # Get dataset stats
-                dataset_stats = DatasetStats(
-                    row_count=len(df),
-                    column_count=len(df.columns),
-                    missing_value_count=int(df.isna().sum().sum()),
-                    duplicate_row_count=int(df.duplicated().sum()),
-                    outlier_count=0
-                )
+            recommendation = await self._recommend(problem, options, df, get_dataset_stats, dataset_name)
 
-                # Get dataset name from session
-                dataset_name = getattr(self, '_current_dataset_name', 'dataset')
+        return options, recommendation
 
-                # Call OpenAI for recommendation
-                recommended_id, reason = self.openai_client.generate_recommendation(
-                    problem=problem,
-                    options=options,
-                    dataset_stats=dataset_stats,
-                    dataset_name=dataset_name
-                )
+    async def _recommend(
+        self,
+        problem: Problem,
+        options: List,
+        df: pd.DataFrame,
+        get_dataset_stats: Optional[Callable[[], DatasetStats]] = None,
+        dataset_name: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Get a GPT recommendation for a problem's options.
 
-                if recommended_id and reason:
-                    recommendation = GPTRecommendation(
-                        recommended_option_id=recommended_id,
-                        reason=reason
-                    )
-                    print(f"[GPT] Recommended: {recommended_id} - {reason}")
-                else:
-                    print(f"[INFO] No GPT recommendation generated")
+        Structurally identical problems (same type, columns, options and examples,
+        same bucketed metrics, same dataset) reuse one recommendation instead of
+        calling GPT again.
 
-            except Exception as e:
-                # Fail silently - no recommendation shown
-                print(f"[WARNING] Failed to generate GPT recommendation: {e}")
-                recommendation = None
+        Args:
+            problem: Problem object
+            options: Options generated for the problem
+            df: Current DataFrame
+            get_dataset_stats: Returns stats for df (computed from df if omitted)
+            dataset_name: Name of the session's dataset
 
-        return options, recommendation
+        Returns:
+            GPTRecommendation or None
+        """
+        try:
+            from .models import GPTRecommendation
+
+            # Get dataset stats
+            if get_dataset_stats is not None:
+                dataset_stats = get_dataset_stats()
+            else:
+                dataset_stats = self._dataset_stats_from_df(df)
+
+            # The session's own name: the agent serves concurrent sessions
+            if dataset_name is None:
+                dataset_name = 'dataset'
+
+            signature = _recommendation_signature(problem, options, dataset_stats, dataset_name)
+            cached = self._recommendation_by_signature.get(signature)
+            if cached is not None:
+                self._recommendation_by_signature.move_to_end(signature)
+                option_index, reason = cached
+                recommended_id = options[option_index].option_id
+                print(f"[GPT] Reusing recommendation for identical problem: {recommended_id}")
+                return GPTRecommendation(recommended_option_id=recommended_id, reason=reason)
+
+            # Call OpenAI for recommendation
+            recommended_id, reason = await self.openai_client.generate_recommendation(
+                problem=problem,
+                options=options,
+                dataset_stats=dataset_stats,
+                dataset_name=dataset_name
+            )
+
+            if not (recommended_id and reason):
+                print(f"[INFO] No GPT recommendation generated")
+                return None
+
+            option_index = next(i for i, opt in enumerate(options) if opt.option_id == recommended_id)
+            self._recommendation_by_signature[signature] = (option_index, reason)
+            if len(self._recommendation_by_signature) > RECOMMENDATION_CONFIG.get("signature_cache_size", 256):
+                self._recommendation_by_signature.popitem(last=False)
+
+            print(f"[GPT] Recommended: {recommended_id} - {reason}")
+            return GPTRecommendation(
+                recommended_option_id=recommended_id,
+                reason=reason
+            )
+
+        except Exception as e:
+            # Fail silently - no recommendation shown
+            print(f"[WARNING] Failed to generate GPT recommendation: {e}")
+            return None
+
+    def _dataset_stats_from_df(self, df: pd.DataFrame) -> DatasetStats:
+        """
+        Build DatasetStats for a recommendation prompt when no session stats were passed.
+
+        Args:
+            df: Current DataFrame
+
+        Returns:
+            DatasetStats (outliers are not counted)
+        """
+        return DatasetStats(
+            row_count=len(df),
+            column_count=len(df.columns),
+            # One reduction over the whole null mask instead of a per-column sum of sums
+            missing_value_count=int(df.isna().to_numpy().sum()),
+            duplicate_row_count=int(df.duplicated().sum()),
+            outlier_count=0
+        )
 
     def _create_static_options(
         self,
@@ -524,43 +1082,16 @@ class CleaningAgent:
         Returns:
             List of CleaningOption objects with static pros/cons
         """
-        from .models import CleaningOption, ProblemType
-        from .config import DEFAULT_PROS_CONS
-
-        # Map operation function names to DEFAULT_PROS_CONS keys
-        OPERATION_TO_PROSCONS_KEY = {
-            "drop_columns": "drop_columns",
-            "drop_missing_rows": "drop_rows",
-            "fill_with_mean": "fill_mean",
-            "fill_with_median": "fill_median",
-            "fill_with_mode": "fill_mode",
-            "fill_with_value": "fill_with_value",
-            "remove_outliers": "remove_outliers",
-            "cap_outliers": "cap_outliers",
-            "drop_duplicate_rows": "drop_duplicates_first",
-            "drop_duplicate_columns": "drop_duplicate_columns",
-        }
+        from .models import CleaningOption
 
         options = []
 
         for i, template in enumerate(option_templates):
             operation_type = template["operation_type"]
 
-            # Handle context-dependent no_operation mapping
-            if operation_type == "no_operation":
-                if problem.problem_type == ProblemType.MISSING_VALUES:
-                    proscons_key = "keep_missing"
-                elif problem.problem_type == ProblemType.OUTLIERS:
-                    proscons_key = "keep_outliers"
-                elif problem.problem_type == ProblemType.HIGH_CARDINALITY:
-                    proscons_key = "keep_high_cardinality"
-                else:
-                    proscons_key = "keep_missing"  # Default fallback
-            elif operation_type == "drop_columns" and problem.problem_type == ProblemType.HIGH_CARDINALITY:
-                # Special case for dropping high cardinality columns
-                proscons_key = "drop_high_cardinality"
-            else:
-                # Get the appropriate key for DEFAULT_PROS_CONS
+            # Get the appropriate key for DEFAULT_PROS_CONS (problem-specific first)
+            proscons_key = PROBLEM_PROSCONS_KEY.get((operation_type, problem.problem_type))
+            if proscons_key is None:
                 proscons_key = OPERATION_TO_PROSCONS_KEY.get(operation_type, operation_type)
 
             # Get static pros/cons from config
@@ -577,18 +1108,20 @@ class CleaningAgent:
                 parameters=template["parameters"],
                 pros=pros,
                 cons=cons,
-                impact_metrics={},  # No dynamic metrics needed
+                impact_metrics=EMPTY_IMPACT_METRICS,  # No dynamic metrics needed
                 requires_input=template.get("requires_input", False)
             )
             options.append(option)
 
         return options
 
-    def _generate_format_inconsistency_options(
+    async def _generate_format_inconsistency_options(
         self,
         problem: Problem,
         df: pd.DataFrame,
-        include_recommendation: bool = True
+        include_recommendation: bool = True,
+        get_dataset_stats: Optional[Callable[[], DatasetStats]] = None,
+        dataset_name: Optional[str] = None
     ) -> Tuple[List, Any]:
         """
         Generate dynamic options for format inconsistency problems.
@@ -600,11 +1133,14 @@ class CleaningAgent:
             problem: Problem object with format inconsistency details
             df: Current DataFrame
             include_recommendation: Whether to include GPT recommendation (default True)
+            get_dataset_stats: Returns stats for df, only called if a recommendation is
+                requested (stats are computed from df if omitted)
+            dataset_name: Name of the session's dataset, sent with the recommendation request
 
         Returns:
             Tuple of (List of CleaningOption objects, Optional GPTRecommendation)
         """
-        from .models import CleaningOption, GPTRecommendation
+        from .models import CleaningOption
 
         format_type = problem.metadata.get("format_type", "")
         column = problem.metadata.get("column", "")
@@ -703,43 +1239,14 @@ class CleaningAgent:
             parameters={},
             pros=DEFAULT_PROS_CONS.get("keep_format", {}).get("pros", "Preserves original data."),
             cons=DEFAULT_PROS_CONS.get("keep_format", {}).get("cons", "Inconsistent formats may cause issues."),
-            impact_metrics={}
+            impact_metrics=EMPTY_IMPACT_METRICS
         )
         options.append(option)
 
         # Generate GPT recommendation if enabled and requested
         recommendation = None
         if include_recommendation and self.enable_gpt_recommendations and self.openai_client and len(options) > 1:
-            try:
-                from .models import DatasetStats
-
-                dataset_stats = DatasetStats(
-                    row_count=len(df),
-                    column_count=len(df.columns),
-                    missing_value_count=int(df.isna().sum().sum()),
-                    duplicate_row_count=int(df.duplicated().sum()),
-                    outlier_count=0
-                )
-
-                dataset_name = getattr(self, '_current_dataset_name', 'dataset')
-
-                recommended_id, reason = self.openai_client.generate_recommendation(
-                    problem=problem,
-                    options=options,
-                    dataset_stats=dataset_stats,
-                    dataset_name=dataset_name
-                )
-
-                if recommended_id and reason:
-                    recommendation = GPTRecommendation(
-                        recommended_option_id=recommended_id,
-                        reason=reason
-                    )
-                    print(f"[GPT] Recommended: {recommended_id} - {reason}")
-
-            except Exception as e:
-                print(f"[WARNING] Failed to generate GPT recommendation for format: {e}")
-                recommendation = None
+            recommendation = await self._recommend(problem, options, df, get_dataset_stats, dataset_name)
 
         return options, recommendation
 
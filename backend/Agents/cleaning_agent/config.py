@@ -2,6 +2,8 @@
 Configuration and templates for cleaning operations.
 """
 
+from types import MappingProxyType
+
 # Thresholds for problem detection
 DETECTION_THRESHOLDS = {
     "missing_values": {
@@ -17,10 +19,12 @@ DETECTION_THRESHOLDS = {
     "duplicates": {
         "min_count": 1,  # Minimum duplicates to report
         "critical_percentage": 20.0,  # >20% duplicates is critical
+        "polars_min_cells": 1_000_000,  # Hash rows with polars (if installed) from this many cells
     },
     "format_inconsistency": {
         "min_inconsistency_percentage": 5.0,  # Minimum 5% inconsistent to report
         "min_unique_formats": 2,  # Need at least 2 different formats
+        "parallel_min_columns": 8,  # Check columns on a thread pool from this many columns
     },
     "high_cardinality": {
         "uniqueness_threshold": 0.90,  # 90% unique = high cardinality
@@ -253,6 +257,18 @@ SESSION_CONFIG = {
     "backup_cleanup_interval": 3600,  # Cleanup interval in seconds (1 hour)
 }
 
+# pandas.read_csv options for loading session datasets
+CSV_READ_OPTIONS = {
+    "engine": "c",  # Fast C parser
+    "low_memory": False,  # Parse in one pass so each column gets a single inferred dtype
+}
+
+# Parsed dataset + detected problems cache, keyed by file content hash
+DATASET_CACHE_CONFIG = {
+    "max_entries": 8,  # Number of (DataFrame, problems) pairs to keep
+    "hash_chunk_size": 1024 * 1024,  # Bytes read per step when hashing the file
+}
+
 # Visualization impact templates
 VISUALIZATION_IMPACT_TEMPLATES = {
     "missing_values": {
@@ -349,6 +365,11 @@ OPENAI_CONFIG = {
     "temperature": 0.7,
     "max_completion_tokens": 800,
     "timeout": 10,  # seconds
+    "max_backoff": 30.0,  # Cap on a single rate limit retry wait, server hints included (seconds)
+    "max_concurrency": 20,  # API calls in flight at once per client
+    "requests_per_minute": 500,  # Request pacing budget (token bucket rate and burst size)
+    "rate_decrease_factor": 0.8,  # Multiply the pacing rate by this after a rate limit error
+    "rate_recovery_factor": 1.05,  # ...and by this after each successful call, up to the budget
 }
 
 # GPT Recommendation configuration
@@ -359,4 +380,39 @@ RECOMMENDATION_CONFIG = {
     "temperature": 0.3,  # Lower = more deterministic recommendations
     "max_completion_tokens": 150,  # Keep reasons short and concise
     "max_retries": 1,  # Retry once on failure (2 attempts total)
+    "bulk_enabled": True,  # Recommend for all problems in one call at session start
+    "bulk_timeout": 30,  # Timeout for the bulk recommendation call (seconds)
+    "bulk_max_problems": 15,  # Problems coalesced into one bulk call (larger sets are split)
+    "bulk_max_prompt_tokens": 6000,  # Estimated per-call budget for the problem details
+    "context_window": 128000,  # Model context size; bulk calls that wouldn't fit are split
+    "concurrent_fill": True,  # Request problems the bulk call missed concurrently, one call each
+    "mode": "realtime",  # "realtime" (chat completions) or "batch" (Batch API, half cost, slow)
+    "batch_completion_window": "24h",  # Batch API completion window (non-interactive runs)
+    "batch_poll_interval": 30,  # Seconds between Batch API status checks
+    "signature_percentage_bucket": 5,  # Percentages within the same 5% bucket share a recommendation
+    "signature_cache_size": 256,  # Recommendations kept per structural problem signature
+    "prompt_cache_size": 512,  # Built single-problem prompts kept for reuse
 }
+
+# In-memory cache of GPT responses for identical requests
+RESPONSE_CACHE_CONFIG = {
+    "max_entries": 256,
+    "max_temperature": 0.5,  # Above this, responses vary too much to reuse
+}
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# The detection and option templates are static: expose them read-only so they
+# can't be mutated by accident (callers that need a mutable copy use dict(...))
+DETECTION_THRESHOLDS = _freeze(DETECTION_THRESHOLDS)
+CLEANING_OPERATIONS = _freeze(CLEANING_OPERATIONS)
+VISUALIZATION_IMPACT_TEMPLATES = _freeze(VISUALIZATION_IMPACT_TEMPLATES)
+DEFAULT_PROS_CONS = _freeze(DEFAULT_PROS_CONS)
@@ -1,13 +1,22 @@
 """
 Problem detection functions for the cleaning agent.
+
+Problems are built with Problem.model_construct: every field is produced here
+with its final type (severity as its string value), so per-problem pydantic
+validation is skipped.
 """
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import List, Dict, Any, Iterator, Optional
+import os
+import threading
 import uuid
 import re
-from collections import Counter
+import hashlib
 
 from .models import Problem, ProblemType, ProblemSeverity
 from .config import DETECTION_THRESHOLDS, VISUALIZATION_IMPACT_TEMPLATES
@@ -29,26 +38,41 @@ def detect_all_problems(df: pd.DataFrame) -> List[Problem]:
     """
     problems = []
 
+    # Nothing to check in a frame without rows
+    n_rows = len(df)
+    if n_rows == 0:
+        return problems
+
     # PRIORITY 1: Detect format inconsistencies FIRST
     # This ensures data is in consistent format before other checks
     # Example: "N/A" in date columns won't be detected as missing until format is standardized
     problems.extend(detect_format_inconsistency_problems(df))
 
+    # The float64 numeric block and its NaN mask are built once and shared
+    # by the missing-value and outlier passes; distinct counts are shared by
+    # the outlier and duplicate-column passes
+    numeric = _numeric_block(df)
+    distinct_counts = _distinct_counts(df)
+
     # PRIORITY 2: Detect missing values
     # Now that formats are consistent, missing values are more accurately detected
-    problems.extend(detect_missing_value_problems(df))
+    problems.extend(detect_missing_value_problems(df, numeric))
 
     # PRIORITY 3: Detect outliers
     # Properly formatted numeric data allows accurate outlier detection
-    problems.extend(detect_outlier_problems(df))
+    # (IQR needs at least 4 values, so tiny frames can't have outliers)
+    if n_rows >= 4:
+        problems.extend(detect_outlier_problems(df, numeric, distinct_counts))
 
     # PRIORITY 4: Detect duplicate rows
-    duplicate_row_problem = detect_duplicate_row_problem(df)
+    # Row hashes are computed once here and shared with row-level detectors
+    row_hashes = _hash_rows(df)
+    duplicate_row_problem = detect_duplicate_row_problem(df, row_hashes)
     if duplicate_row_problem:
         problems.append(duplicate_row_problem)
 
     # PRIORITY 5: Detect duplicate columns
-    duplicate_column_problem = detect_duplicate_column_problem(df)
+    duplicate_column_problem = detect_duplicate_column_problem(df, distinct_counts)
     if duplicate_column_problem:
         problems.append(duplicate_column_problem)
 
@@ -58,40 +82,67 @@ def detect_all_problems(df: pd.DataFrame) -> List[Problem]:
     return problems
 
 
-def detect_missing_value_problems(df: pd.DataFrame) -> List[Problem]:
+def detect_missing_value_problems(df: pd.DataFrame, numeric: Optional[Dict[str, Any]] = None) -> List[Problem]:
     """
     Detect missing value problems for each column with missing data.
 
+    Args:
+        df: DataFrame to check
+        numeric: Shared numeric block from _numeric_block (its NaN mask is reused)
+
     Returns:
         List of Problem objects for columns with missing values
     """
     problems = []
     thresholds = DETECTION_THRESHOLDS["missing_values"]
+    severity_edges = np.array([
+        thresholds["min_percentage"],
+        thresholds["warning_percentage"],
+        thresholds["critical_percentage"],
+    ])
+    # Index 0 is below the minimum threshold (not reported)
+    severity_levels = (
+        None,
+        (ProblemSeverity.INFO.value, "info"),
+        (ProblemSeverity.WARNING.value, "warning"),
+        (ProblemSeverity.CRITICAL.value, "critical"),
+    )
 
-    for column in df.columns:
-        null_count = df[column].isna().sum()
-        null_percentage = (null_count / len(df)) * 100 if len(df) > 0 else 0
-
+    # One pass over the whole null mask instead of a per-column isna() scan
+    if numeric is None or len(numeric["columns"]) == 0:
+        null_counts = df.isna().sum(axis=0).to_numpy()
+    else:
+        # Numeric columns reuse the block's NaN mask; only the rest are scanned
+        numeric_null_counts = pd.Series(numeric["isna"].sum(axis=0), index=numeric["columns"])
+        other_null_counts = df.drop(columns=numeric["columns"]).isna().sum(axis=0)
+        null_counts = pd.concat([other_null_counts, numeric_null_counts]).reindex(df.columns).to_numpy(dtype=np.int64)
+    if len(df) > 0:
+        null_percentages = (null_counts / len(df)) * 100
+    else:
+        null_percentages = np.zeros(len(null_counts))
+
+    # Classify every column at once: a percentage equal to a threshold
+    # belongs to that threshold's level
+    level_indices = np.searchsorted(severity_edges, null_percentages, side="right")
+
+    # Bind loop invariants to locals once instead of per reported column
+    build_problem = Problem.model_construct
+    problem_type = ProblemType.MISSING_VALUES
+    problem_ids = _uuid_pool(int(np.count_nonzero(level_indices)))
+    for column, null_count, null_percentage, level_index in zip(
+        df.columns, null_counts, null_percentages, level_indices
+    ):
         # Only report if above minimum threshold
-        if null_percentage < thresholds["min_percentage"]:
+        level = severity_levels[level_index]
+        if level is None:
             continue
+        severity, variant = level
 
-        # Determine severity
-        if null_percentage >= thresholds["critical_percentage"]:
-            severity = ProblemSeverity.CRITICAL
-        elif null_percentage >= thresholds["warning_percentage"]:
-            severity = ProblemSeverity.WARNING
-        else:
-            severity = ProblemSeverity.INFO
+        vis_impact = _visualization_impact("missing_values", variant, percentage=f"{null_percentage:.1f}")
 
-        # Get visualization impact
-        vis_impact = VISUALIZATION_IMPACT_TEMPLATES["missing_values"][severity.name.lower()].format(
-            percentage=f"{null_percentage:.1f}"
-        )
-
-        problem = Problem(
-            problem_id=str(uuid.uuid4()),
-            problem_type=ProblemType.MISSING_VALUES,
+        problem = build_problem(
+            problem_id=next(problem_ids),
+            problem_type=problem_type,
             severity=severity,
             title=f"Missing Values in '{column}'",
             description=f"{null_count} rows ({null_percentage:.1f}%) have missing values in the '{column}' column.",
@@ -108,42 +159,62 @@ def detect_missing_value_problems(df: pd.DataFrame) -> List[Problem]:
     return problems
 
 
-def detect_outlier_problems(df: pd.DataFrame) -> List[Problem]:
+def detect_outlier_problems(
+    df: pd.DataFrame,
+    numeric: Optional[Dict[str, Any]] = None,
+    distinct_counts: Optional[pd.Series] = None
+) -> List[Problem]:
     """
     Detect outlier problems for numeric columns using IQR method.
 
+    Args:
+        df: DataFrame to check
+        numeric: Shared numeric block from _numeric_block (built here if omitted)
+        distinct_counts: Shared distinct counts from _distinct_counts (constant columns are skipped)
+
     Returns:
         List of Problem objects for columns with outliers
     """
     problems = []
     thresholds = DETECTION_THRESHOLDS["outliers"]
+    min_count = thresholds["min_count"]
+    critical_pct = thresholds["critical_percentage"]
 
-    # Only check numeric columns
-    numeric_columns = df.select_dtypes(include=[np.number]).columns
+    # IQR bounds and outlier masks for all numeric columns in one vectorized pass
+    outliers_by_column = _detect_outliers_iqr(
+        numeric if numeric is not None else _numeric_block(df),
+        distinct_counts
+    )
 
-    for column in numeric_columns:
-        outlier_info = _detect_outliers_iqr(df, column)
+    # Bind loop invariants to locals once instead of per reported column
+    build_problem = Problem.model_construct
+    problem_type = ProblemType.OUTLIERS
+    critical = ProblemSeverity.CRITICAL.value
+    warning = ProblemSeverity.WARNING.value
 
-        if outlier_info["outlier_count"] < thresholds["min_count"]:
+    n_rows = len(df)
+    problem_ids = _uuid_pool(len(outliers_by_column))
+    for column, outlier_info in outliers_by_column.items():
+        if outlier_info["outlier_count"] < min_count:
             continue
 
-        outlier_percentage = (outlier_info["outlier_count"] / len(df)) * 100 if len(df) > 0 else 0
+        outlier_percentage = (outlier_info["outlier_count"] / n_rows) * 100 if n_rows > 0 else 0
 
-        # Determine severity
-        if outlier_percentage >= thresholds["critical_percentage"]:
-            severity = ProblemSeverity.CRITICAL
+        # Determine severity and visualization impact
+        if outlier_percentage >= critical_pct:
+            severity, variant = critical, "critical"
         else:
-            severity = ProblemSeverity.WARNING
+            severity, variant = warning, "warning"
 
-        # Get visualization impact
-        vis_impact = VISUALIZATION_IMPACT_TEMPLATES["outliers"][severity.name.lower()].format(
+        vis_impact = _visualization_impact(
+            "outliers", variant,
             count=outlier_info["outlier_count"],
             percentage=f"{outlier_percentage:.1f}"
         )
 
-        problem = Problem(
-            problem_id=str(uuid.uuid4()),
-            problem_type=ProblemType.OUTLIERS,
+        problem = build_problem(
+            problem_id=next(problem_ids),
+            problem_type=problem_type,
             severity=severity,
             title=f"Outliers in '{column}'",
             description=f"{outlier_info['outlier_count']} outliers ({outlier_percentage:.1f}%) detected using IQR method in the '{column}' column.",
@@ -163,16 +234,26 @@ def detect_outlier_problems(df: pd.DataFrame) -> List[Problem]:
     return problems
 
 
-def detect_duplicate_row_problem(df: pd.DataFrame) -> Problem:
+def detect_duplicate_row_problem(df: pd.DataFrame, row_hashes: Optional[np.ndarray] = None) -> Problem:
     """
     Detect duplicate rows in the dataset.
 
+    Args:
+        df: DataFrame to check
+        row_hashes: Per-row hashes from _hash_rows (avoids re-hashing every row)
+
     Returns:
         Problem object if duplicates found, None otherwise
     """
     thresholds = DETECTION_THRESHOLDS["duplicates"]
 
-    duplicate_count = df.duplicated().sum()
+    if row_hashes is not None:
+        # Equal rows always share a hash, but a shared hash doesn't prove
+        # equality: only rows in shared buckets are compared for real
+        candidates = pd.Series(row_hashes).duplicated(keep=False).to_numpy()
+        duplicate_count = int(df[candidates].duplicated().sum()) if candidates.any() else 0
+    else:
+        duplicate_count = int(df.duplicated().sum())
 
     if duplicate_count < thresholds["min_count"]:
         return None
@@ -181,21 +262,20 @@ def detect_duplicate_row_problem(df: pd.DataFrame) -> Problem:
 
     # Determine severity
     if duplicate_percentage >= thresholds["critical_percentage"]:
-        severity = ProblemSeverity.CRITICAL
-        vis_impact = VISUALIZATION_IMPACT_TEMPLATES["duplicates_rows"]["critical"]
+        severity, variant = ProblemSeverity.CRITICAL, "critical"
     else:
-        severity = ProblemSeverity.WARNING
-        vis_impact = VISUALIZATION_IMPACT_TEMPLATES["duplicates_rows"]["warning"]
+        severity, variant = ProblemSeverity.WARNING, "warning"
 
-    vis_impact = vis_impact.format(
-        count=duplicate_count,
+    vis_impact = _visualization_impact(
+        "duplicates_rows", variant,
+        count=int(duplicate_count),
         percentage=f"{duplicate_percentage:.1f}"
     )
 
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.DUPLICATES_ROWS,
-        severity=severity,
+        severity=severity.value,
         title="Duplicate Rows Detected",
         description=f"{duplicate_count} duplicate rows ({duplicate_percentage:.1f}%) found in the dataset.",
         affected_columns=[],  # Affects all columns
@@ -207,42 +287,43 @@ def detect_duplicate_row_problem(df: pd.DataFrame) -> Problem:
     )
 
 
-def detect_duplicate_column_problem(df: pd.DataFrame) -> Problem:
+def detect_duplicate_column_problem(df: pd.DataFrame, distinct_counts: Optional[pd.Series] = None) -> Problem:
     """
     Detect duplicate columns in the dataset.
 
+    Args:
+        df: DataFrame to check
+        distinct_counts: Shared distinct counts from _distinct_counts (computed here if omitted)
+
     Returns:
         Problem object if duplicate columns found, None otherwise
     """
-    duplicate_pairs = _detect_duplicate_columns(df)
+    duplicate_pairs = _detect_duplicate_columns(df, distinct_counts)
 
     if len(duplicate_pairs) == 0:
         return None
 
     # Extract unique duplicate columns (each column may appear in multiple pairs)
-    duplicate_columns = set()
-    for col1, col2 in duplicate_pairs:
-        duplicate_columns.add(col2)  # Keep first column, mark second as duplicate
+    # Keep first column, mark second as duplicate
+    duplicate_columns = {col2 for _, col2 in duplicate_pairs}
 
     duplicate_count = len(duplicate_columns)
 
     # Determine severity (duplicate columns are typically warning or info)
     severity = ProblemSeverity.WARNING if duplicate_count > 2 else ProblemSeverity.INFO
-    vis_impact = VISUALIZATION_IMPACT_TEMPLATES["duplicates_columns"][severity.name.lower()].format(
-        count=duplicate_count
-    )
+    vis_impact = _visualization_impact("duplicates_columns", severity.name.lower(), count=duplicate_count)
 
-    # Format column pairs for description
-    pair_descriptions = [f"'{col1}' and '{col2}'" for col1, col2 in duplicate_pairs[:3]]
+    # Format column pairs for description (only the first 3 are shown)
+    pair_summary = ", ".join(f"'{col1}' and '{col2}'" for col1, col2 in duplicate_pairs[:3])
     if len(duplicate_pairs) > 3:
-        pair_descriptions.append(f"and {len(duplicate_pairs) - 3} more pairs")
+        pair_summary += f", and {len(duplicate_pairs) - 3} more pairs"
 
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.DUPLICATES_COLUMNS,
-        severity=severity,
+        severity=severity.value,
         title="Duplicate Columns Detected",
-        description=f"{duplicate_count} duplicate columns found: {', '.join(pair_descriptions)}.",
+        description=f"{duplicate_count} duplicate columns found: {pair_summary}.",
         affected_columns=list(duplicate_columns),
         visualization_impact=vis_impact,
         metadata={
@@ -257,75 +338,425 @@ def detect_duplicate_column_problem(df: pd.DataFrame) -> Problem:
 # Helper Functions
 # ============================================================================
 
-def _detect_outliers_iqr(df: pd.DataFrame, column: str) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _visualization_impact(
+    problem_key: str,
+    variant: str,
+    percentage: Optional[str] = None,
+    count: Optional[int] = None
+) -> str:
     """
-    Detect outliers using IQR method.
+    Format a visualization-impact template.
+
+    Cached on (problem, variant, rounded percentage, count) since many columns
+    share the same rounded percentage (e.g. fully empty columns at 100.0%).
+    """
+    return VISUALIZATION_IMPACT_TEMPLATES[problem_key][variant].format(
+        percentage=percentage,
+        count=count
+    )
+
+
+def _uuid_pool(n: int) -> Iterator[str]:
+    """
+    Yield up to n random (version 4) UUID strings from a single os.urandom read.
+
+    Detectors that create one problem per column draw IDs from this instead of
+    calling uuid.uuid4() (one urandom syscall) per problem.
+    """
+    random_bytes = os.urandom(16 * n)
+    for offset in range(0, 16 * n, 16):
+        yield str(uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4))
+
+
+_polars = None
+
+
+def _get_polars():
+    """Import polars on first use (returns None when it isn't installed)"""
+    global _polars
+    if _polars is None:
+        try:
+            import polars
+        except ImportError:
+            polars = False
+        _polars = polars
+    return _polars or None
+
+
+def _hash_rows(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """
+    Hash every row of the DataFrame (index excluded).
+
+    Large frames are hashed with polars' multi-threaded hash_rows when polars
+    is installed; otherwise (or if the conversion fails) pandas is used.
+
+    Hashing is bitwise, so floats are canonicalized first (-0.0 -> 0.0, any
+    NaN -> one NaN) to keep rows that DataFrame.duplicated considers equal in
+    one bucket. Object columns hash by their string form, which can split
+    equal values (1 vs 1.0), so frames with them aren't hashed at all.
 
     Returns:
-        Dict with outlier information including sample values
+        uint64 array with one hash per row, or None if the frame can't be hashed
+        (e.g. object columns, unhashable cell values or a frame without columns)
     """
-    values = df[column].dropna()
+    if any(dtype == object for dtype in df.dtypes):
+        return None
 
-    if len(values) < 4:  # Need at least 4 values for IQR
-        return {
-            'outlier_count': 0,
-            'lower_bound': None,
-            'upper_bound': None,
-            'example_outliers': []
-        }
+    float_columns = {}
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            values = df.iloc[:, position].to_numpy()
+            float_columns[position] = np.where(np.isnan(values), np.nan, values + 0.0)
+        elif pd.api.types.is_float_dtype(dtype):
+            # Nullable floats: missing values are masked, only -0.0 needs folding
+            float_columns[position] = df.iloc[:, position] + 0.0
+    if float_columns:
+        df = df.copy(deep=False)
+        for position, values in float_columns.items():
+            df.isetitem(position, values)
+
+    if df.size >= DETECTION_THRESHOLDS["duplicates"]["polars_min_cells"] and len(df.columns) > 0:
+        pl = _get_polars()
+        if pl is not None:
+            try:
+                return pl.from_pandas(df).hash_rows().to_numpy()
+            except Exception:
+                # Columns polars can't convert (e.g. mixed objects): use pandas
+                pass
+
+    try:
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except (TypeError, ValueError):
+        return None
 
-    Q1 = values.quantile(0.25)
-    Q3 = values.quantile(0.75)
-    IQR = Q3 - Q1
 
-    iqr_multiplier = DETECTION_THRESHOLDS["outliers"]["iqr_multiplier"]
-    lower_bound = Q1 - iqr_multiplier * IQR
-    upper_bound = Q3 + iqr_multiplier * IQR
-
-    outlier_mask = (df[column] < lower_bound) | (df[column] > upper_bound)
-    outlier_count = outlier_mask.sum()
-
-    # Get sample outlier values (up to 5 examples)
-    example_outliers = []
-    if outlier_count > 0:
-        outlier_values = df.loc[outlier_mask, column].dropna()
-        # Get unique outlier values, sorted by how extreme they are
-        unique_outliers = outlier_values.unique()
-        # Take up to 5 examples, prefer extreme values
-        sorted_outliers = sorted(unique_outliers, key=lambda x: abs(x - values.median()), reverse=True)
-        example_outliers = [round(float(v), 2) for v in sorted_outliers[:5]]
+# Quantiles (25th, 50th, 75th percentile) computed by the IQR kernel
+IQR_QUANTILES = (0.25, 0.5, 0.75)
+
+def _iqr_columns_loop(arr, iqr_multiplier):
+    """
+    Per-column IQR statistics over a float64 block, compiled with numba when installed.
+
+    Quartiles follow NumPy's default linear interpolation (same virtual
+    index and lerp as np.nanpercentile), so results match the NumPy path.
+    Every column must hold at least one non-null value.
+
+    Returns:
+        Tuple of (quartiles (3, n_cols), lower_bounds, upper_bounds, outlier_counts)
+    """
+    n_rows, n_cols = arr.shape
+    quartiles = np.empty((3, n_cols), dtype=np.float64)
+    lower_bounds = np.empty(n_cols, dtype=np.float64)
+    upper_bounds = np.empty(n_cols, dtype=np.float64)
+    outlier_counts = np.zeros(n_cols, dtype=np.int64)
+
+    for j in range(n_cols):
+        # Compact the column's non-null values
+        values = np.empty(n_rows, dtype=np.float64)
+        n = 0
+        for i in range(n_rows):
+            v = arr[i, j]
+            if not np.isnan(v):
+                values[n] = v
+                n += 1
+        values = values[:n]
+
+        # Select the order statistics each quantile interpolates between
+        previous = np.empty(3, dtype=np.int64)
+        following = np.empty(3, dtype=np.int64)
+        gammas = np.empty(3, dtype=np.float64)
+        for k in range(3):
+            q = IQR_QUANTILES[k]
+            virtual_index = n * q + (1 + q * -1) - 1
+            previous[k] = int(np.floor(virtual_index))
+            following[k] = min(previous[k] + 1, n - 1)
+            gammas[k] = virtual_index - previous[k]
+        values = np.partition(values, np.unique(np.concatenate((previous, following))))
+
+        for k in range(3):
+            a = values[previous[k]]
+            b = values[following[k]]
+            diff = b - a
+            if gammas[k] >= 0.5:
+                quartiles[k, j] = b - diff * (1 - gammas[k])
+            else:
+                quartiles[k, j] = a + diff * gammas[k]
+
+        iqr = quartiles[2, j] - quartiles[0, j]
+        lo = quartiles[0, j] - iqr_multiplier * iqr
+        hi = quartiles[2, j] + iqr_multiplier * iqr
+        lower_bounds[j] = lo
+        upper_bounds[j] = hi
+
+        # NaN compares False on both sides, so it is never an outlier
+        count = 0
+        for i in range(n):
+            if values[i] < lo or values[i] > hi:
+                count += 1
+        outlier_counts[j] = count
+
+    return quartiles, lower_bounds, upper_bounds, outlier_counts
+
+
+_iqr_kernel = None
+_iqr_kernel_lock = threading.Lock()
+
+
+def _get_iqr_kernel():
+    """
+    Return the compiled IQR kernel, or None to use the NumPy path.
+
+    numba is imported (and the kernel compiled) on first use rather than at
+    module import, so loading the cleaning agent doesn't pay for it up front.
+    The kernel is compiled serially (no parallel=True): numba's parallel
+    runtime hung when launched from the worker threads detection runs in.
+    Compilation is locked because detection can run on several threads at once.
+    """
+    global _iqr_kernel
+    if _iqr_kernel is None:
+        with _iqr_kernel_lock:
+            if _iqr_kernel is None:
+                try:
+                    import numba
+                    _iqr_kernel = numba.njit(cache=True)(_iqr_columns_loop)
+                except ImportError:  # numba is optional; detection falls back to NumPy
+                    _iqr_kernel = False
+    return _iqr_kernel or None
+
+
+def _distinct_counts(df: pd.DataFrame) -> Optional[pd.Series]:
+    """
+    Number of distinct values per column, NaN counted as a value.
 
+    Returns:
+        Series indexed like df.columns, or None if a column holds unhashable values
+    """
+    try:
+        return df.nunique(dropna=False)
+    except TypeError:
+        return None
+
+
+def _numeric_block(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Materialize the numeric columns once as a float64 block.
+
+    Returns:
+        Dict with the numeric column labels ("columns"), the float64 values
+        ("values", missing as NaN) and their NaN mask ("isna")
+    """
+    numeric_df = df.select_dtypes(include=[np.number])
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
     return {
-        'outlier_count': int(outlier_count),
-        'lower_bound': float(lower_bound),
-        'upper_bound': float(upper_bound),
-        'example_outliers': example_outliers
+        "columns": numeric_df.columns,
+        "values": values,
+        "isna": np.isnan(values),
     }
 
 
-def _detect_duplicate_columns(df: pd.DataFrame) -> List[tuple]:
+def _detect_outliers_iqr(
+    numeric: Dict[str, Any],
+    distinct_counts: Optional[pd.Series] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Detect outliers in every numeric column using the IQR method.
+
+    Quartiles, bounds and outlier counts come from the compiled IQR kernel
+    when numba is installed, otherwise from a single np.nanpercentile call
+    over the whole numeric block with the bounds broadcast across columns.
+
+    Args:
+        numeric: Numeric block from _numeric_block
+        distinct_counts: Distinct counts from _distinct_counts, used to skip
+            constant columns (their IQR is 0 and no value lies outside it)
+
+    Returns:
+        Dict mapping column name to outlier information including sample values
+        (columns with fewer than 4 non-null values are skipped)
+    """
+    if len(numeric["columns"]) == 0:
+        return {}
+
+    # Need at least 4 values for IQR
+    valid = np.count_nonzero(~numeric["isna"], axis=0) >= 4
+    if distinct_counts is not None:
+        valid &= distinct_counts.reindex(numeric["columns"]).to_numpy() > 1
+    if not valid.any():
+        return {}
+    columns = numeric["columns"][valid]
+    arr = numeric["values"][:, valid]
+
+    iqr_multiplier = DETECTION_THRESHOLDS["outliers"]["iqr_multiplier"]
+
+    kernel = _get_iqr_kernel()
+    if kernel is not None:
+        # Compiled kernel: quartiles, bounds and counts per column in one pass
+        quartiles, lower_bounds, upper_bounds, outlier_counts = kernel(arr, float(iqr_multiplier))
+        medians = quartiles[1]
+    else:
+        # The median comes out of the same call and is reused to rank example outliers
+        Q1, medians, Q3 = np.nanpercentile(arr, [25, 50, 75], axis=0)
+        IQR = Q3 - Q1
+        lower_bounds = Q1 - iqr_multiplier * IQR
+        upper_bounds = Q3 + iqr_multiplier * IQR
+        outlier_counts = ((arr < lower_bounds) | (arr > upper_bounds)).sum(axis=0)
+
+    results = {}
+    for j, column in enumerate(columns):
+        outlier_count = outlier_counts[j]
+
+        # Get sample outlier values (up to 5 examples)
+        example_outliers = []
+        if outlier_count > 0:
+            # Get unique outlier values and how extreme they are
+            x = arr[:, j]
+            # Unique values in order of first appearance (as Series.unique returns them)
+            unique_outliers = pd.unique(x[(x < lower_bounds[j]) | (x > upper_bounds[j])])
+            distances = np.abs(unique_outliers - medians[j])
+
+            # Take up to 5 examples, prefer extreme values (ties keep first-appearance
+            # order, matching a stable sort by distance over Series.unique())
+            if unique_outliers.size > 5:
+                kth = np.partition(distances, -5)[-5]
+                beyond = np.flatnonzero(distances > kth)
+                ties = np.flatnonzero(distances == kth)[:5 - beyond.size]
+                selected = np.sort(np.concatenate([beyond, ties]))
+            else:
+                selected = np.arange(unique_outliers.size)
+            order = selected[np.argsort(-distances[selected], kind="stable")]
+            example_outliers = [round(float(v), 2) for v in unique_outliers[order]]
+
+        results[column] = {
+            'outlier_count': int(outlier_count),
+            'lower_bound': float(lower_bounds[j]),
+            'upper_bound': float(upper_bounds[j]),
+            'example_outliers': example_outliers
+        }
+
+    return results
+
+
+def _detect_duplicate_columns(df: pd.DataFrame, distinct_counts: Optional[pd.Series] = None) -> List[tuple]:
     """
     Detect duplicate columns (columns with identical values).
 
+    Columns are first grouped by cheap statistics (dtype, null count, distinct
+    count, first and last value); only groups with two or more columns are
+    hashed, and only columns that land in the same hash bucket are compared
+    element-wise.
+
     Returns:
         List of tuples containing duplicate column pairs
     """
-    duplicate_pairs = []
     columns = df.columns.tolist()
 
-    for i in range(len(columns)):
-        for j in range(i + 1, len(columns)):
-            col1, col2 = columns[i], columns[j]
+    # Pre-filter: identical columns share dtype, null count, distinct count
+    # and the values in their first and last rows
+    null_counts = df.isna().sum(axis=0).to_numpy()
+    if distinct_counts is None:
+        distinct_counts = _distinct_counts(df)
+    if distinct_counts is not None:
+        distinct_values = distinct_counts.to_numpy()
+    else:
+        # Unhashable values (e.g. lists): group by dtype and null count only
+        distinct_values = [None] * len(columns)
+
+    # First and last row of every column, as one small object array
+    edge_values = (df.iloc[[0, -1]] if len(df) > 0 else df).to_numpy(dtype=object).T
+
+    groups: Dict[tuple, List[int]] = {}
+    for position, dtype in enumerate(df.dtypes):
+        signature = (
+            str(dtype),
+            int(null_counts[position]),
+            distinct_values[position],
+            _edge_fingerprint(edge_values[position])
+        )
+        groups.setdefault(signature, []).append(position)
 
-            # Compare columns element-wise
-            try:
-                if df[col1].equals(df[col2]):
-                    duplicate_pairs.append((col1, col2))
-            except:
-                # Handle comparison errors (e.g., different dtypes)
-                continue
+    # Bucket candidate column positions by content hash (O(C*N) instead of O(C^2*N))
+    buckets: Dict[Any, List[int]] = {}
+    candidates = [position for group in groups.values() if len(group) > 1 for position in group]
+    for position in candidates:
+        series = df.iloc[:, position]
+        try:
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+                # Plain numeric columns: digest the raw buffer directly, skipping
+                # the per-row hash pass. The digest is bitwise, so floats are
+                # canonicalized first (-0.0 -> 0.0, any NaN -> one NaN) to keep
+                # columns that Series.equals considers identical in one bucket.
+                values = series.to_numpy()
+                if values.dtype.kind == "f":
+                    values = np.where(np.isnan(values), np.nan, values + 0.0)
+                buffer = memoryview(np.ascontiguousarray(values))
+            else:
+                if pd.api.types.is_float_dtype(series.dtype):
+                    # Nullable floats: row hashing is bitwise, so fold -0.0 into 0.0 as .equals does
+                    series = series + 0.0
+                buffer = memoryview(pd.util.hash_pandas_object(series, index=False).to_numpy())
+            key = hashlib.blake2b(buffer, digest_size=16).digest()
+        except TypeError:
+            # Unhashable values (e.g. lists): compare against other such columns of the same dtype
+            key = ("unhashable", str(series.dtype))
+        buckets.setdefault(key, []).append(position)
+
+    duplicate_pairs = []
+    for positions in buckets.values():
+        if len(positions) < 2:
+            continue
+
+        # Verify within the bucket to guard against hash collisions.
+        # Materialize each column once; plain numeric columns are compared as
+        # NumPy arrays, everything else goes through Series.equals.
+        series_by_position = {position: df.iloc[:, position] for position in positions}
+        arrays = {
+            position: series.to_numpy()
+            for position, series in series_by_position.items()
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf"
+        }
 
-    return duplicate_pairs
+        for a in range(len(positions)):
+            for b in range(a + 1, len(positions)):
+                i, j = positions[a], positions[b]
+                left, right = arrays.get(i), arrays.get(j)
+                try:
+                    if left is not None and right is not None:
+                        is_duplicate = left.dtype == right.dtype and np.array_equal(
+                            left, right, equal_nan=left.dtype.kind == "f"
+                        )
+                    else:
+                        is_duplicate = series_by_position[i].equals(series_by_position[j])
+                    if is_duplicate:
+                        duplicate_pairs.append((i, j))
+                except Exception:
+                    # Handle comparison errors (e.g., different dtypes)
+                    continue
+
+    # Report pairs in column order, as the pairwise scan did
+    duplicate_pairs.sort()
+    return [(columns[i], columns[j]) for i, j in duplicate_pairs]
+
+
+def _edge_fingerprint(edge_values: np.ndarray) -> tuple:
+    """
+    Hashable fingerprint of a column's first and last values for duplicate pre-filtering.
+
+    Missing values all map to None (NaN never equals itself as a dict key) and
+    unhashable values (e.g. lists) to a placeholder, so identical columns
+    always share a fingerprint.
+    """
+    fingerprint = []
+    for value in edge_values:
+        try:
+            hash(value)
+        except TypeError:
+            value = "<unhashable>"
+        else:
+            if pd.isna(value):
+                value = None
+        fingerprint.append(value)
+    return tuple(fingerprint)
 
 
 # ============================================================================
@@ -347,6 +778,21 @@ DATE_PATTERNS = {
     "DD Month YYYY": r"^\d{1,2}\s+[A-Za-z]+\s+\d{4}$",
 }
 
+# DATE_PATTERNS compiled once, grouped by regex: several formats share the
+# same pattern (e.g. DD/MM/YYYY and MM/DD/YYYY), so each regex is scanned once
+# and its matches are attributed to every format name that uses it
+_COMPILED_DATE_PATTERNS = [
+    (re.compile(pattern), [name for name, other in DATE_PATTERNS.items() if other == pattern])
+    for pattern in dict.fromkeys(DATE_PATTERNS.values())
+]
+
+# Any date pattern at all, as one alternation. Patterns overlap (e.g.
+# "Mon DD, YYYY" and "Month DD, YYYY"), so this only finds candidate values;
+# the per-format counts still come from the individual patterns.
+_ANY_DATE_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in dict.fromkeys(DATE_PATTERNS.values()))
+)
+
 # Boolean value patterns
 BOOLEAN_PATTERNS = {
     "Yes/No": {"yes", "no"},
@@ -357,6 +803,15 @@ BOOLEAN_PATTERNS = {
     "On/Off": {"on", "off"},
 }
 
+# Every value any boolean pattern accepts, to skip non-boolean columns early
+_ALL_BOOLEAN_VALUES = frozenset().union(*BOOLEAN_PATTERNS.values())
+
+# Arrow-backed strings for the format checks need the optional pyarrow package
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+
+# Case styles reported by the case inconsistency check (in report order)
+CASE_STYLES = ("UPPERCASE", "lowercase", "Title Case", "Mixed Case")
+
 # Case patterns
 CASE_PATTERNS = {
     "UPPERCASE": lambda s: s.isupper(),
@@ -379,74 +834,95 @@ def detect_format_inconsistency_problems(df: pd.DataFrame) -> List[Problem]:
     Returns:
         List of Problem objects for columns with format inconsistencies
     """
-    problems = []
     thresholds = DETECTION_THRESHOLDS.get("format_inconsistency", {
         "min_inconsistency_percentage": 5.0,
         "min_unique_formats": 2
     })
 
-    for column in df.columns:
-        # Skip numeric columns for format checks (but check for mixed types below)
-        if pd.api.types.is_numeric_dtype(df[column]):
-            continue
+    # Columns are independent, so wide frames are checked on a thread pool
+    # (map keeps results in column order)
+    workers = min(os.cpu_count() or 1, len(df.columns))
+    if workers > 1 and len(df.columns) >= thresholds.get("parallel_min_columns", 8):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda column: _check_column_format(df, column, thresholds), df.columns))
+    else:
+        results = [_check_column_format(df, column, thresholds) for column in df.columns]
 
-        non_null_values = df[column].dropna()
-        if len(non_null_values) < 3:  # Need at least 3 values to detect patterns
-            continue
+    return [problem for problem in results if problem]
 
-        # Check for mixed data types (numeric strings mixed with text)
-        mixed_type_problem = _detect_mixed_numeric_text(df, column, non_null_values, thresholds)
-        if mixed_type_problem:
-            problems.append(mixed_type_problem)
-            continue  # Don't check other formats if it's a mixed type issue
-
-        # Check for date format inconsistencies
-        date_problem = _detect_date_format_inconsistency(df, column, non_null_values, thresholds)
-        if date_problem:
-            problems.append(date_problem)
-            continue  # Don't check other formats if it's a date column
-
-        # Check for boolean format inconsistencies
-        boolean_problem = _detect_boolean_format_inconsistency(df, column, non_null_values, thresholds)
-        if boolean_problem:
-            problems.append(boolean_problem)
-            continue
 
-        # Check for case inconsistencies (only for text columns that look like names/titles)
-        case_problem = _detect_case_inconsistency(df, column, non_null_values, thresholds)
-        if case_problem:
-            problems.append(case_problem)
+def _check_column_format(df: pd.DataFrame, column: str, thresholds: Dict) -> Optional[Problem]:
+    """
+    Run the format checks on one column, returning the first problem found (if any).
+    """
+    # Skip numeric columns for format checks (but check for mixed types below)
+    if pd.api.types.is_numeric_dtype(df[column]):
+        return None
 
-    return problems
+    non_null_values = df[column].dropna()
+    if len(non_null_values) < 3:  # Need at least 3 values to detect patterns
+        return None
+
+    # Convert to strings once for all checks
+    str_values = _as_strings(non_null_values)
+
+    # Check for mixed data types (numeric strings mixed with text)
+    mixed_type_problem = _detect_mixed_numeric_text(df, column, non_null_values, str_values, thresholds)
+    if mixed_type_problem:
+        return mixed_type_problem  # Don't check other formats if it's a mixed type issue
+
+    # Check for date format inconsistencies
+    date_problem = _detect_date_format_inconsistency(df, column, non_null_values, str_values, thresholds)
+    if date_problem:
+        return date_problem  # Don't check other formats if it's a date column
+
+    # Boolean and case checks compare values without surrounding whitespace
+    stripped_values = str_values.str.strip()
+
+    # Check for boolean format inconsistencies
+    boolean_problem = _detect_boolean_format_inconsistency(df, column, non_null_values, stripped_values, thresholds)
+    if boolean_problem:
+        return boolean_problem
+
+    # Check for case inconsistencies (only for text columns that look like names/titles)
+    return _detect_case_inconsistency(df, column, non_null_values, stripped_values, thresholds)
+
+
+def _as_strings(values: pd.Series) -> pd.Series:
+    """
+    Convert values to strings, Arrow-backed when pyarrow is installed.
+
+    pandas 3 already returns Arrow-backed strings from astype(str) when
+    pyarrow is available; on older pandas the object result is converted so
+    the .str operations in the format checks run on Arrow compute kernels.
+    """
+    str_values = values.astype(str)
+    if PYARROW_AVAILABLE and str_values.dtype == object:
+        str_values = str_values.astype("string[pyarrow]")
+    return str_values
 
 
 def _detect_mixed_numeric_text(
     df: pd.DataFrame,
     column: str,
     values: pd.Series,
+    str_values: pd.Series,
     thresholds: Dict
 ) -> Optional[Problem]:
     """
     Detect if a column contains a mix of numeric and text values.
     This indicates a data quality issue where a numeric column has text entries.
+    str_values is values converted with astype(str).
     """
-    str_values = values.astype(str)
-    
-    numeric_count = 0
-    text_count = 0
-    numeric_examples = []
-    text_examples = []
-    
-    for val in str_values:
-        try:
-            float(val)
-            numeric_count += 1
-            if len(numeric_examples) < 3:
-                numeric_examples.append(val)
-        except (ValueError, TypeError):
-            text_count += 1
-            if len(text_examples) < 3:
-                text_examples.append(val)
+    # Parse each distinct value once and broadcast the result back to rows
+    codes, uniques = pd.factorize(str_values)
+    parses = np.fromiter(map(_parses_as_float, uniques), dtype=bool, count=len(uniques))
+    numeric_mask = parses[codes]
+
+    numeric_count = int(np.count_nonzero(numeric_mask))
+    text_count = len(str_values) - numeric_count
+    numeric_examples = str_values[numeric_mask].head(3).tolist()
+    text_examples = str_values[~numeric_mask].head(3).tolist()
     
     # Need both numeric and text values
     if numeric_count == 0 or text_count == 0:
@@ -461,10 +937,10 @@ def _detect_mixed_numeric_text(
     
     vis_impact = f"Mixed data types will prevent proper numeric analysis and may cause visualization errors. {text_count} text values found in what appears to be a numeric column."
     
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.FORMAT_INCONSISTENCY,
-        severity=severity,
+        severity=severity.value,
         title=f"Mixed Data Types in '{column}'",
         description=f"Column '{column}' contains {numeric_count} numeric values and {text_count} text values. This should be a numeric column.",
         affected_columns=[column],
@@ -482,28 +958,57 @@ def _detect_mixed_numeric_text(
     )
 
 
+def _parses_as_float(value: str) -> bool:
+    """Check whether float() accepts a string (including 'nan', 'inf' and '1_000')"""
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
 def _detect_date_format_inconsistency(
     df: pd.DataFrame,
     column: str,
     values: pd.Series,
+    str_values: pd.Series,
     thresholds: Dict
 ) -> Optional[Problem]:
     """
     Detect if a column contains dates in multiple formats.
+    str_values is values converted with astype(str).
     """
-    # Convert to strings
-    str_values = values.astype(str)
+    # Patterns are matched against distinct values and broadcast back to rows
+    codes, uniques = pd.factorize(str_values)
+    uniques = pd.Index(uniques)
+
+    # One scan for values matching any date pattern. Matched distinct values
+    # can't exceed matched rows, so a column with too few date-like rows
+    # fails the 50% check below regardless of the per-format split.
+    is_candidate = np.asarray(uniques.str.match(_ANY_DATE_PATTERN, na=False), dtype=bool)
+    if np.count_nonzero(is_candidate[codes]) < len(values) * 0.5:
+        return None
+    candidates = uniques[is_candidate]
 
-    # Count how many values match each date pattern
-    format_counts = {}
+    # Count how many values match each date pattern (one scan per distinct regex)
+    format_matches = {}
     matched_values = set()
 
-    for format_name, pattern in DATE_PATTERNS.items():
-        matches = str_values.str.match(pattern, na=False)
-        match_count = matches.sum()
-        if match_count > 0:
-            format_counts[format_name] = match_count
-            matched_values.update(str_values[matches].tolist())
+    for regex, format_names in _COMPILED_DATE_PATTERNS:
+        unique_matches = np.zeros(len(uniques), dtype=bool)
+        unique_matches[is_candidate] = candidates.str.match(regex, na=False)
+        if unique_matches.any():
+            matches = unique_matches[codes]
+            for format_name in format_names:
+                format_matches[format_name] = matches
+            matched_values.update(uniques[unique_matches].tolist())
+
+    # Keep DATE_PATTERNS order so ties sort the same way
+    format_counts = {
+        format_name: np.count_nonzero(format_matches[format_name])
+        for format_name in DATE_PATTERNS
+        if format_name in format_matches
+    }
 
     # Check if we have multiple formats
     if len(format_counts) < 2:
@@ -518,12 +1023,10 @@ def _detect_date_format_inconsistency(
     sorted_formats = sorted(format_counts.items(), key=lambda x: x[1], reverse=True)
     detected_formats = {fmt: int(count) for fmt, count in sorted_formats}  # Convert to Python int
 
-    # Get examples of each format
+    # Get examples of each format (reusing the match masks from above)
     format_examples = {}
-    for format_name, pattern in DATE_PATTERNS.items():
-        if format_name in detected_formats:
-            matches = str_values[str_values.str.match(pattern, na=False)]
-            format_examples[format_name] = matches.head(3).tolist()
+    for format_name in format_counts:
+        format_examples[format_name] = str_values[format_matches[format_name]].head(3).tolist()
 
     # Create problem
     inconsistent_count = total_matched - sorted_formats[0][1]
@@ -536,10 +1039,10 @@ def _detect_date_format_inconsistency(
         "Inconsistent date formats may cause parsing errors and incorrect chronological ordering in visualizations."
     )
 
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.FORMAT_INCONSISTENCY,
-        severity=severity,
+        severity=severity.value,
         title=f"Inconsistent Date Formats in '{column}'",
         description=f"Found {len(detected_formats)} different date formats in '{column}': {', '.join(detected_formats.keys())}.",
         affected_columns=[column],
@@ -560,28 +1063,34 @@ def _detect_boolean_format_inconsistency(
     df: pd.DataFrame,
     column: str,
     values: pd.Series,
+    str_values: pd.Series,
     thresholds: Dict
 ) -> Optional[Problem]:
     """
     Detect if a column contains boolean values in multiple formats.
+    str_values is values converted with astype(str) and stripped of surrounding whitespace.
     """
     # Get unique values (lowercased for comparison)
-    str_values = values.astype(str).str.strip()
-    unique_values = set(str_values.str.lower().unique())
+    lowered = str_values.str.lower()
+    unique_values = set(lowered.unique())
+    if unique_values.isdisjoint(_ALL_BOOLEAN_VALUES):
+        return None
 
     # Check which boolean patterns are present
     detected_patterns = {}
+    pattern_masks = {}
     for pattern_name, pattern_values in BOOLEAN_PATTERNS.items():
         matching_values = unique_values.intersection(pattern_values)
         if len(matching_values) > 0:
             # Count how many rows match this pattern
-            mask = str_values.str.lower().isin(pattern_values)
+            mask = lowered.isin(pattern_values)
             count = mask.sum()
             if count > 0:
                 detected_patterns[pattern_name] = {
                     "count": count,
                     "values": list(matching_values)
                 }
+                pattern_masks[pattern_name] = mask
 
     # Check if we have multiple formats
     if len(detected_patterns) < 2:
@@ -594,11 +1103,8 @@ def _detect_boolean_format_inconsistency(
 
     # Get examples of actual values
     format_examples = {}
-    for pattern_name, pattern_info in detected_patterns.items():
-        pattern_values = BOOLEAN_PATTERNS[pattern_name]
-        mask = str_values.str.lower().isin(pattern_values)
-        examples = str_values[mask].head(3).tolist()
-        format_examples[pattern_name] = examples
+    for pattern_name, mask in pattern_masks.items():
+        format_examples[pattern_name] = str_values[mask].head(3).tolist()
 
     severity = ProblemSeverity.INFO
 
@@ -607,10 +1113,10 @@ def _detect_boolean_format_inconsistency(
         "Inconsistent boolean formats may cause grouping errors and incorrect aggregations."
     )
 
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.FORMAT_INCONSISTENCY,
-        severity=severity,
+        severity=severity.value,
         title=f"Inconsistent Boolean Formats in '{column}'",
         description=f"Found {len(detected_patterns)} different boolean formats: {', '.join(detected_patterns.keys())}.",
         affected_columns=[column],
@@ -629,14 +1135,15 @@ def _detect_case_inconsistency(
     df: pd.DataFrame,
     column: str,
     values: pd.Series,
+    str_values: pd.Series,
     thresholds: Dict
 ) -> Optional[Problem]:
     """
     Detect if a text column has inconsistent casing (e.g., mix of UPPERCASE, lowercase, Title Case).
     Only applies to columns that look like names or categorical text.
+    str_values is values converted with astype(str) and stripped of surrounding whitespace.
     """
-    # Convert to strings and filter out very long values (likely descriptions, not names)
-    str_values = values.astype(str).str.strip()
+    # Filter out very long values (likely descriptions, not names)
     str_values = str_values[str_values.str.len() <= 50]  # Focus on shorter text
     str_values = str_values[str_values.str.len() >= 2]   # At least 2 characters
 
@@ -648,28 +1155,18 @@ def _detect_case_inconsistency(
     if has_numbers.sum() > len(str_values) * 0.5:
         return None
 
-    # Detect case patterns
-    case_counts = {
-        "UPPERCASE": 0,
-        "lowercase": 0,
-        "Title Case": 0,
-        "Mixed Case": 0
-    }
-
-    for val in str_values:
-        # Only check alphabetic characters
-        alpha_only = ''.join(c for c in val if c.isalpha())
-        if len(alpha_only) < 2:
-            continue
+    # Classify each distinct value once and broadcast the style back to rows
+    codes, uniques = pd.factorize(str_values)
+    unique_styles = np.fromiter(
+        (CASE_STYLES.index(style) if style else -1 for style in map(_case_style, uniques)),
+        dtype=np.int64,
+        count=len(uniques)
+    )
+    styles = unique_styles[codes]
 
-        if alpha_only.isupper():
-            case_counts["UPPERCASE"] += 1
-        elif alpha_only.islower():
-            case_counts["lowercase"] += 1
-        elif val.istitle() or _is_title_case(val):
-            case_counts["Title Case"] += 1
-        else:
-            case_counts["Mixed Case"] += 1
+    # Detect case patterns
+    style_counts = np.bincount(styles[styles >= 0], minlength=len(CASE_STYLES))
+    case_counts = {style: int(count) for style, count in zip(CASE_STYLES, style_counts)}
 
     # Remove zero counts
     case_counts = {k: v for k, v in case_counts.items() if v > 0}
@@ -693,26 +1190,10 @@ def _detect_case_inconsistency(
 
     # Get examples of each case
     case_examples = {
-        "UPPERCASE": [],
-        "lowercase": [],
-        "Title Case": [],
-        "Mixed Case": []
+        style: str_values[styles == index].head(3).tolist()
+        for index, style in enumerate(CASE_STYLES)
     }
 
-    for val in str_values:
-        alpha_only = ''.join(c for c in val if c.isalpha())
-        if len(alpha_only) < 2:
-            continue
-
-        if alpha_only.isupper() and len(case_examples["UPPERCASE"]) < 3:
-            case_examples["UPPERCASE"].append(val)
-        elif alpha_only.islower() and len(case_examples["lowercase"]) < 3:
-            case_examples["lowercase"].append(val)
-        elif (val.istitle() or _is_title_case(val)) and len(case_examples["Title Case"]) < 3:
-            case_examples["Title Case"].append(val)
-        elif len(case_examples["Mixed Case"]) < 3:
-            case_examples["Mixed Case"].append(val)
-
     # Remove empty examples
     case_examples = {k: v for k, v in case_examples.items() if v}
 
@@ -723,10 +1204,10 @@ def _detect_case_inconsistency(
         "Inconsistent text casing may cause duplicate categories in charts and incorrect groupings."
     )
 
-    return Problem(
+    return Problem.model_construct(
         problem_id=str(uuid.uuid4()),
         problem_type=ProblemType.FORMAT_INCONSISTENCY,
-        severity=severity,
+        severity=severity.value,
         title=f"Inconsistent Text Casing in '{column}'",
         description=f"Found {len(case_counts)} different text case styles: {', '.join(case_counts.keys())}.",
         affected_columns=[column],
@@ -741,6 +1222,28 @@ def _detect_case_inconsistency(
     )
 
 
+@lru_cache(maxsize=4096)
+def _case_style(val: str) -> Optional[str]:
+    """
+    Classify a value's casing as one of CASE_STYLES (None if it has fewer than 2 letters).
+
+    Cached because categorical values recur across columns and across the
+    re-detection that follows every applied operation.
+    """
+    # Only check alphabetic characters
+    alpha_only = ''.join(filter(str.isalpha, val))
+    if len(alpha_only) < 2:
+        return None
+
+    if alpha_only.isupper():
+        return "UPPERCASE"
+    if alpha_only.islower():
+        return "lowercase"
+    if val.istitle() or _is_title_case(val):
+        return "Title Case"
+    return "Mixed Case"
+
+
 def _is_title_case(s: str) -> bool:
     """
     Check if a string is in title case, allowing for common exceptions.
@@ -753,7 +1256,7 @@ def _is_title_case(s: str) -> bool:
     exceptions = {'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}
 
     for i, word in enumerate(words):
-        alpha_only = ''.join(c for c in word if c.isalpha())
+        alpha_only = ''.join(filter(str.isalpha, word))
         if not alpha_only:
             continue
 
@@ -790,12 +1293,18 @@ def detect_high_cardinality_problems(df: pd.DataFrame) -> List[Problem]:
     if len(df) < thresholds["min_rows"]:
         return problems
 
+    # Bind loop invariants to locals once instead of per column
+    build_problem = Problem.model_construct
+    problem_type = ProblemType.HIGH_CARDINALITY
+    is_numeric_dtype = pd.api.types.is_numeric_dtype
+
+    problem_ids = _uuid_pool(len(df.columns))
     for column in df.columns:
         # Check if column name looks like an identifier
         is_identifier = _is_identifier_column_name(column)
 
         # Skip numeric columns unless name looks like ID
-        is_numeric = pd.api.types.is_numeric_dtype(df[column])
+        is_numeric = is_numeric_dtype(df[column])
         if is_numeric and not is_identifier:
             continue
 
@@ -815,15 +1324,15 @@ def detect_high_cardinality_problems(df: pd.DataFrame) -> List[Problem]:
 
         # Determine severity and visualization impact
         if is_identifier:
-            severity = ProblemSeverity.INFO
-            vis_impact = VISUALIZATION_IMPACT_TEMPLATES["high_cardinality"]["identifier"].format(
-                percentage=f"{uniqueness_ratio * 100:.1f}"
+            severity = ProblemSeverity.INFO.value
+            vis_impact = _visualization_impact(
+                "high_cardinality", "identifier", percentage=f"{uniqueness_ratio * 100:.1f}"
             )
             title = f"Identifier Column: '{column}'"
         else:
-            severity = ProblemSeverity.WARNING
-            vis_impact = VISUALIZATION_IMPACT_TEMPLATES["high_cardinality"]["warning"].format(
-                percentage=f"{uniqueness_ratio * 100:.1f}"
+            severity = ProblemSeverity.WARNING.value
+            vis_impact = _visualization_impact(
+                "high_cardinality", "warning", percentage=f"{uniqueness_ratio * 100:.1f}"
             )
             title = f"High Cardinality: '{column}'"
 
@@ -837,9 +1346,9 @@ def detect_high_cardinality_problems(df: pd.DataFrame) -> List[Problem]:
             f"Sample values: {', '.join(sample_values[:3])}{'...' if len(sample_values) > 3 else ''}."
         )
 
-        problems.append(Problem(
-            problem_id=str(uuid.uuid4()),
-            problem_type=ProblemType.HIGH_CARDINALITY,
+        problems.append(build_problem(
+            problem_id=next(problem_ids),
+            problem_type=problem_type,
             severity=severity,
             title=title,
             description=description,
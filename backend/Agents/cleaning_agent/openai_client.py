@@ -2,16 +2,120 @@
 OpenAI API client for generating cleaning option recommendations.
 """
 
-from openai import OpenAI, RateLimitError
+from openai import RateLimitError
+import asyncio
+import hashlib
 import json
-import time
 import re
 import os
-from typing import List, Optional, Tuple
+import random
+import time
+import orjson
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+from .._openai_shared import get_async_openai_client
 from .models import Problem, CleaningOption, DatasetStats
-from .prompts import generate_recommendation_prompt
-from .config import OPENAI_CONFIG, RECOMMENDATION_CONFIG
+from .prompts import generate_recommendation_prompt, generate_bulk_recommendation_prompt
+from .config import OPENAI_CONFIG, RECOMMENDATION_CONFIG, RESPONSE_CACHE_CONFIG
+
+# Compiled once: these run on every rate limit error and every fenced response
+# "try again in 20s", "2m", "1m30.5s" or "250ms"
+_RETRY_AFTER_PATTERN = re.compile(r'try again in (?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)(ms|s))?')
+_FENCE_PREFIX_PATTERN = re.compile(r'^```(?:json)?\s*')
+_FENCE_SUFFIX_PATTERN = re.compile(r'\s*```$')
+_JSON_SEPARATOR_PATTERN = re.compile(r'[\s,:]*')
+
+_json_decoder = json.JSONDecoder()
+
+_encoding = None
+
+
+def _get_encoding():
+    """Load the recommendation model's tiktoken encoding on first use (None when unavailable)"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            encoding = tiktoken.encoding_for_model(RECOMMENDATION_CONFIG.get("model", OPENAI_CONFIG["model"]))
+        except Exception:
+            # tiktoken not installed, unknown model, or encoding files can't be fetched
+            encoding = False
+        _encoding = encoding
+    return _encoding or None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Count prompt tokens with tiktoken when installed, else estimate ~4 characters per token"""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+
+def _complete_json_entries(content: str) -> Dict[str, Any]:
+    """
+    Parse the complete top-level entries of a JSON object, ignoring a truncated tail
+
+    A bulk response cut off by max_completion_tokens is invalid JSON as a
+    whole, but every entry before the cut is still a usable answer.
+
+    Args:
+        content: Text of a JSON object, possibly cut off part-way
+
+    Returns:
+        Mapping of the entries that were received in full
+    """
+    entries = {}
+    position = content.find("{") + 1
+    if not position:
+        return entries
+
+    try:
+        while True:
+            position = _JSON_SEPARATOR_PATTERN.match(content, position).end()
+            key, position = _json_decoder.raw_decode(content, position)
+            position = _JSON_SEPARATOR_PATTERN.match(content, position).end()
+            value, position = _json_decoder.raw_decode(content, position)
+            if isinstance(key, str):
+                entries[key] = value
+    except json.JSONDecodeError:
+        pass
+    return entries
+
+
+class _TokenBucket:
+    """Async token bucket that spaces request starts to a requests-per-minute budget"""
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Args:
+            requests_per_minute: Sustained request rate (also the burst capacity)
+        """
+        self.base_rate = requests_per_minute / 60.0
+        self.rate = self.base_rate
+        self.capacity = float(requests_per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        """Wait until a request may start, then take its token"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def slow_down(self):
+        """Cut the rate after a rate limit error (never below 1 request per minute)"""
+        self.rate = max(self.rate * OPENAI_CONFIG["rate_decrease_factor"], 1 / 60.0)
+
+    def recover(self):
+        """Step the rate back toward the configured budget after a successful call"""
+        self.rate = min(self.rate * OPENAI_CONFIG["rate_recovery_factor"], self.base_rate)
 
 
 class CleaningOpenAIClient:
@@ -29,34 +133,157 @@ class CleaningOpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_async_openai_client(self.api_key)
         self.model = OPENAI_CONFIG["model"]
 
-    def _parse_retry_after(self, error_message: str) -> float:
+        # Concurrency cap and request pacing shared by every call this client makes.
+        # The semaphore is created on first use in each event loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        self._bucket = _TokenBucket(OPENAI_CONFIG["requests_per_minute"])
+
+        # blake2b(request) -> response content, least recently used first
+        self._resp_cache: "OrderedDict[str, str]" = OrderedDict()
+
+        # (problem details, options, dataset) -> single-problem prompt, least recently used first
+        self._prompt_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+        # blake2b(request) -> API call in flight, shared by identical concurrent requests
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _response_cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """
+        Content-addressed cache key for a chat completion request
+
+        Re-uploading a dataset reuses its detected problems (and so their ids),
+        which makes the prompts byte-identical to the earlier session's.
+
+        Args:
+            request: Keyword arguments for chat.completions.create (without timeout)
+
+        Returns:
+            Cache key, or None if the temperature is too high for responses to be reused
+        """
+        if request.get("temperature", 1.0) > RESPONSE_CACHE_CONFIG["max_temperature"]:
+            return None
+        return hashlib.blake2b(
+            orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return cached response content for a key (None on miss or uncacheable request)"""
+        if cache_key is None:
+            return None
+        content = self._resp_cache.get(cache_key)
+        if content is not None:
+            self._resp_cache.move_to_end(cache_key)
+        return content
+
+    def _cache_response(self, cache_key: Optional[str], content: str):
+        """Store response content that parsed into a valid recommendation"""
+        if cache_key is None:
+            return
+        self._resp_cache[cache_key] = content
+        if len(self._resp_cache) > RESPONSE_CACHE_CONFIG["max_entries"]:
+            self._resp_cache.popitem(last=False)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the concurrency semaphore for the running event loop
+
+        Returns:
+            Semaphore allowing OPENAI_CONFIG["max_concurrency"] calls in flight
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(OPENAI_CONFIG["max_concurrency"])
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _retry_after_from_headers(self, error: RateLimitError) -> Optional[float]:
+        """
+        Read the server's retry hint from a rate limit response's headers
+
+        Args:
+            error: RateLimitError raised by the SDK
+
+        Returns:
+            Retry after time in seconds, or None if the response has no usable header
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+
+        for header, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                return float(value) / scale
+            except (TypeError, ValueError):
+                continue  # e.g. an HTTP-date retry-after; fall back to the message
+
+        return None
+
+    def _parse_retry_after(self, error_message: str, default: Optional[float] = 20.0) -> Optional[float]:
         """
         Parse retry_after time from rate limit error message
 
         Args:
             error_message: Error message from OpenAI
+            default: Value returned when the message has no retry time
 
         Returns:
             Retry after time in seconds (default 20s)
         """
-        # Try to parse "Please try again in Xs" or "Please try again in Xm"
-        match = re.search(r'try again in (\d+)s', error_message)
-        if match:
-            return float(match.group(1))
-
-        match = re.search(r'try again in (\d+)m', error_message)
-        if match:
-            return float(match.group(1)) * 60
+        # Parse "Please try again in ..." (minutes and/or seconds or milliseconds), one pass
+        match = _RETRY_AFTER_PATTERN.search(error_message)
+        if match and (match.group(1) or match.group(2)):
+            minutes, amount, unit = match.groups()
+            seconds = float(minutes or 0) * 60
+            if amount:
+                seconds += float(amount) / 1000 if unit == "ms" else float(amount)
+            return seconds
 
         # Default to 20 seconds
-        return 20.0
+        return default
+
+    async def _coalesced_call(self, cache_key: Optional[str], timeout: float, request: Dict[str, Any]):
+        """
+        Call chat.completions.create, sharing one call among identical concurrent requests
+
+        A request whose key is already in flight awaits that call's response
+        instead of issuing a duplicate one.
+
+        Args:
+            cache_key: Key from _response_cache_key (None disables coalescing)
+            timeout: Request timeout in seconds
+            request: Keyword arguments for chat.completions.create
+
+        Returns:
+            Chat completion response
+        """
+        if cache_key is None:
+            return await self._call_with_retry(self.client.chat.completions.create, timeout=timeout, **request)
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._call_with_retry(self.client.chat.completions.create, timeout=timeout, **request)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
 
-    def _call_with_retry(self, func, *args, max_retries: int = 2, **kwargs):
+        # Shielded so one caller's cancellation doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+    async def _call_with_retry(self, func, *args, max_retries: int = 2, **kwargs):
         """
-        Call OpenAI API with retry logic
+        Call OpenAI API with retry logic (awaits the async client call)
+
+        Each attempt waits for a concurrency slot and a rate limit token, so
+        concurrent fan-out stays within the account's limits instead of
+        triggering a burst of 429s.
 
         Args:
             func: Function to call
@@ -73,25 +300,37 @@ class CleaningOpenAIClient:
 
         for attempt in range(max_retries + 1):
             try:
-                return func(*args, **kwargs)
+                async with self._get_semaphore():
+                    await self._bucket.acquire()
+                    response = await func(*args, **kwargs)
+                self._bucket.recover()
+                return response
 
             except RateLimitError as e:
                 last_error = e
                 error_msg = str(e)
+                self._bucket.slow_down()
 
                 # If this is the last attempt, raise the error
                 if attempt >= max_retries:
                     print(f"[WARNING] Rate limit exceeded after {max_retries} retries.")
                     raise
 
-                # Parse retry_after from error message
-                retry_after = self._parse_retry_after(error_msg)
-                backoff = min(retry_after, 2 ** attempt)
+                # Full jitter: a random wait up to the exponential step, so
+                # clients that were limited together don't retry together.
+                # A server retry hint (headers first, then the message) is a floor.
+                max_backoff = OPENAI_CONFIG["max_backoff"]
+                backoff = random.uniform(0, min(max_backoff, 2 ** attempt))
+                retry_after = self._retry_after_from_headers(e)
+                if retry_after is None:
+                    retry_after = self._parse_retry_after(error_msg, default=None)
+                if retry_after is not None:
+                    backoff = max(backoff, min(retry_after, max_backoff))
 
                 print(f"[WARNING] Rate limit hit (attempt {attempt + 1}/{max_retries + 1}). "
                       f"Waiting {backoff:.1f}s before retry...")
 
-                time.sleep(backoff)
+                await asyncio.sleep(backoff)
 
             except Exception as e:
                 last_error = e
@@ -102,7 +341,139 @@ class CleaningOpenAIClient:
         if last_error:
             raise last_error
 
-    def generate_recommendation(
+    def _build_recommendation_context(
+        self,
+        problem: Problem,
+        options: List[CleaningOption],
+        dataset_stats: DatasetStats,
+        dataset_name: str
+    ) -> dict:
+        """
+        Build the prompt context for a single problem's recommendation
+
+        Args:
+            problem: Problem with severity, metadata, affected columns
+            options: List of CleaningOption objects
+            dataset_stats: Current dataset statistics (row count, column count)
+            dataset_name: Name of the dataset for context
+
+        Returns:
+            Context dictionary for generate_recommendation_prompt
+        """
+        return {
+            "dataset": {
+                "name": dataset_name,
+                "total_rows": dataset_stats.row_count,
+                "total_columns": dataset_stats.column_count
+            },
+            "problem": {
+                "type": problem.problem_type.value,
+                "title": problem.title,
+                "description": problem.description,
+                "affected_columns": problem.affected_columns,
+                "metadata": problem.metadata
+            },
+            "options": [
+                {
+                    "option_id": opt.option_id,
+                    "option_name": opt.option_name
+                }
+                for opt in options
+            ]
+        }
+
+    def _recommendation_prompt(
+        self,
+        problem: Problem,
+        options: List[CleaningOption],
+        dataset_stats: DatasetStats,
+        dataset_name: str
+    ) -> str:
+        """
+        Return the single-problem recommendation prompt, building it on first use
+
+        Prefetch, on-demand generation and the bulk fill-in can share one build.
+        Re-detection after an operation keeps a problem's id (and title) while
+        its description and metadata change, so those are part of the key.
+
+        Args:
+            problem: Problem with severity, metadata, affected columns
+            options: List of CleaningOption objects
+            dataset_stats: Current dataset statistics (row count, column count)
+            dataset_name: Name of the dataset for context
+
+        Returns:
+            Prompt string
+        """
+        details = hashlib.blake2b(
+            orjson.dumps(
+                [problem.description, problem.metadata],
+                default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ),
+            digest_size=16
+        ).digest()
+        key = (
+            problem.problem_id,
+            details,
+            tuple((opt.option_id, opt.option_name) for opt in options),
+            dataset_stats.row_count,
+            dataset_stats.column_count,
+            dataset_name
+        )
+        prompt = self._prompt_cache.get(key)
+        if prompt is not None:
+            self._prompt_cache.move_to_end(key)
+            return prompt
+
+        context = self._build_recommendation_context(problem, options, dataset_stats, dataset_name)
+        prompt = generate_recommendation_prompt(context)
+
+        self._prompt_cache[key] = prompt
+        if len(self._prompt_cache) > RECOMMENDATION_CONFIG.get("prompt_cache_size", 512):
+            self._prompt_cache.popitem(last=False)
+        return prompt
+
+    def _parse_recommendation_content(
+        self,
+        content: str,
+        options: List[CleaningOption]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Parse a single-problem recommendation response
+
+        Args:
+            content: Raw message content returned by GPT
+            options: Options the recommendation must choose from
+
+        Returns:
+            Tuple of (recommended_option_id, reason) or (None, None) if invalid
+
+        Raises:
+            orjson.JSONDecodeError: If content is not valid JSON (subclass of json.JSONDecodeError)
+        """
+        # Handle potential markdown code blocks
+        content = content.strip()
+        if content.startswith("```"):
+            content = _FENCE_PREFIX_PATTERN.sub('', content)
+            content = _FENCE_SUFFIX_PATTERN.sub('', content)
+
+        data = orjson.loads(content)
+
+        recommended_id = data.get("recommended_option_id")
+        reason = data.get("reason")
+
+        # Validate recommended_id exists in options (non-string ids can't match
+        # and would be unhashable for the set lookup)
+        option_ids = {opt.option_id for opt in options}
+        if not isinstance(recommended_id, str) or recommended_id not in option_ids:
+            print(f"[WARNING] GPT recommended invalid option_id: {recommended_id}")
+            print(f"[INFO] Valid option IDs: {sorted(option_ids)}")
+            return None, None
+
+        return recommended_id, reason
+
+    async def generate_recommendation(
         self,
         problem: Problem,
         options: List[CleaningOption],
@@ -129,41 +500,25 @@ class CleaningOpenAIClient:
             - max_tokens=150 for short, concise reasons
         """
         try:
-            # Build context dictionary
-            context = {
-                "dataset": {
-                    "name": dataset_name,
-                    "total_rows": dataset_stats.row_count,
-                    "total_columns": dataset_stats.column_count
-                },
-                "problem": {
-                    "type": problem.problem_type.value,
-                    "title": problem.title,
-                    "description": problem.description,
-                    "affected_columns": problem.affected_columns,
-                    "metadata": problem.metadata
-                },
-                "options": [
-                    {
-                        "option_id": opt.option_id,
-                        "option_name": opt.option_name
-                    }
-                    for opt in options
-                ]
+            # Generate prompt
+            prompt = self._recommendation_prompt(problem, options, dataset_stats, dataset_name)
+
+            request = {
+                "model": RECOMMENDATION_CONFIG.get("model", self.model),
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": RECOMMENDATION_CONFIG.get("temperature", 0.3),
+                "max_completion_tokens": RECOMMENDATION_CONFIG.get("max_completion_tokens", 150)
             }
 
-            # Generate prompt
-            prompt = generate_recommendation_prompt(context)
+            # Identical requests (e.g. the same dataset uploaded again) reuse the previous response
+            cache_key = self._response_cache_key(request)
+            content = self._get_cached_response(cache_key)
+            if content is not None:
+                print("[GPT] Returning cached recommendation response")
+                return self._parse_recommendation_content(content, options)
 
             # Call OpenAI API with retry
-            response = self._call_with_retry(
-                self.client.chat.completions.create,
-                model=RECOMMENDATION_CONFIG.get("model", self.model),
-                messages=[{"role": "user", "content": prompt}],
-                temperature=RECOMMENDATION_CONFIG.get("temperature", 0.3),
-                max_completion_tokens=RECOMMENDATION_CONFIG.get("max_completion_tokens", 150),
-                timeout=RECOMMENDATION_CONFIG.get("timeout", 8)
-            )
+            response = await self._coalesced_call(cache_key, RECOMMENDATION_CONFIG.get("timeout", 8), request)
 
             # Log token usage
             if response.usage:
@@ -179,28 +534,335 @@ class CleaningOpenAIClient:
                 print("[WARNING] GPT returned empty content")
                 return None, None
 
-            # Handle potential markdown code blocks
-            content = content.strip()
-            if content.startswith("```"):
-                import re
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
+            recommended_id, reason = self._parse_recommendation_content(content, options)
+            if recommended_id:
+                self._cache_response(cache_key, content)
+            return recommended_id, reason
 
-            data = json.loads(content)
+        except Exception as e:
+            # Fail silently - return None, None
+            print(f"[WARNING] Failed to generate GPT recommendation: {type(e).__name__}: {str(e)}")
+            return None, None
 
-            recommended_id = data.get("recommended_option_id")
-            reason = data.get("reason")
+    async def generate_recommendations_bulk(
+        self,
+        problems: List[Problem],
+        options_per_problem: Dict[str, List[CleaningOption]],
+        dataset_stats: DatasetStats,
+        dataset_name: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate GPT recommendations for several problems in as few API calls as possible.
 
-            # Validate recommended_id exists in options
-            option_ids = [opt.option_id for opt in options]
-            if recommended_id not in option_ids:
-                print(f"[WARNING] GPT recommended invalid option_id: {recommended_id}")
-                print(f"[INFO] Valid option IDs: {option_ids}")
-                return None, None
+        Problems are coalesced into chunks that fit RECOMMENDATION_CONFIG's
+        bulk_max_problems and bulk_max_prompt_tokens, one call per chunk,
+        with the chunks requested concurrently.
 
-            return recommended_id, reason
+        Args:
+            problems: Problems to recommend for
+            options_per_problem: Mapping of problem_id to that problem's options
+            dataset_stats: Current dataset statistics (row count, column count)
+            dataset_name: Name of the dataset for context
+
+        Returns:
+            Mapping of problem_id to (recommended_option_id, reason). Problems
+            GPT skipped or answered with an invalid option_id are left out, as
+            are all problems of a chunk whose call failed.
+        """
+        dataset_context = {
+            "name": dataset_name,
+            "total_rows": dataset_stats.row_count,
+            "total_columns": dataset_stats.column_count
+        }
+        problem_contexts = [
+            {
+                "problem_id": problem.problem_id,
+                "type": problem.problem_type.value,
+                "title": problem.title,
+                "description": problem.description,
+                "affected_columns": problem.affected_columns,
+                "metadata": problem.metadata,
+                "options": [
+                    {
+                        "option_id": opt.option_id,
+                        "option_name": opt.option_name
+                    }
+                    for opt in options_per_problem.get(problem.problem_id, [])
+                ]
+            }
+            for problem in problems
+        ]
+
+        chunks = self._chunk_problem_contexts(problem_contexts)
+        results = await asyncio.gather(*(
+            self._generate_recommendations_chunk(dataset_context, chunk, options_per_problem)
+            for chunk in chunks
+        ))
+
+        recommendations = {}
+        for result in results:
+            recommendations.update(result)
+        return recommendations
+
+    def _chunk_problem_contexts(self, problem_contexts: List[dict]) -> List[List[dict]]:
+        """
+        Split problem contexts into chunks small enough for one bulk prompt each
+
+        Token counts are taken from the serialized contexts (see _estimate_tokens),
+        which is close enough for budgeting the prompt.
+
+        Args:
+            problem_contexts: Per-problem prompt contexts, in session order
+
+        Returns:
+            Consecutive chunks of problem contexts
+        """
+        max_problems = RECOMMENDATION_CONFIG.get("bulk_max_problems", 15)
+        max_tokens = RECOMMENDATION_CONFIG.get("bulk_max_prompt_tokens", 6000)
+
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+        for problem_context in problem_contexts:
+            tokens = _estimate_tokens(orjson.dumps(problem_context).decode())
+            if chunk and (len(chunk) >= max_problems or chunk_tokens + tokens > max_tokens):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(problem_context)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def _generate_recommendations_chunk(
+        self,
+        dataset_context: dict,
+        problem_contexts: List[dict],
+        options_per_problem: Dict[str, List[CleaningOption]]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate GPT recommendations for one chunk of problems in a single API call.
+
+        Args:
+            dataset_context: Dataset name, row count and column count
+            problem_contexts: Prompt contexts of the problems in this chunk
+            options_per_problem: Mapping of problem_id to that problem's options
+
+        Returns:
+            Mapping of problem_id to (recommended_option_id, reason), or an
+            empty dict on any error.
+        """
+        try:
+            prompt = generate_bulk_recommendation_prompt({
+                "dataset": dataset_context,
+                "problems": problem_contexts
+            })
+
+            # One short answer per problem, same budget as the single-problem call
+            max_tokens = RECOMMENDATION_CONFIG.get("max_completion_tokens", 150) * len(problem_contexts)
+
+            # Split rather than send a request whose answer can't fit in the context window
+            context_window = RECOMMENDATION_CONFIG.get("context_window", 128000)
+            if len(problem_contexts) > 1 and _estimate_tokens(prompt) + max_tokens > context_window:
+                middle = len(problem_contexts) // 2
+                halves = await asyncio.gather(
+                    self._generate_recommendations_chunk(dataset_context, problem_contexts[:middle], options_per_problem),
+                    self._generate_recommendations_chunk(dataset_context, problem_contexts[middle:], options_per_problem)
+                )
+                return {**halves[0], **halves[1]}
+
+            request = {
+                "model": RECOMMENDATION_CONFIG.get("model", self.model),
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": RECOMMENDATION_CONFIG.get("temperature", 0.3),
+                "max_completion_tokens": max_tokens,
+                "response_format": {"type": "json_object"}
+            }
+
+            cache_key = self._response_cache_key(request)
+            content = self._get_cached_response(cache_key)
+            if content is not None:
+                print("[GPT] Returning cached bulk recommendation response")
+            else:
+                response = await self._coalesced_call(
+                    cache_key, RECOMMENDATION_CONFIG.get("bulk_timeout", 30), request
+                )
+
+                if response.usage:
+                    print(f"[GPT] Bulk token usage - Input: {response.usage.prompt_tokens}, "
+                          f"Output: {response.usage.completion_tokens}")
+
+                content = response.choices[0].message.content
+                if not content:
+                    print("[WARNING] GPT returned empty content for bulk recommendations")
+                    return {}
+
+            try:
+                data = orjson.loads(content)
+                complete = True
+            except orjson.JSONDecodeError:
+                # Truncated response: keep the problems that were answered in full
+                data = _complete_json_entries(content)
+                complete = False
+                print(f"[WARNING] Bulk recommendation response was cut off; "
+                      f"recovered {len(data)}/{len(problem_contexts)} problems")
+
+            recommendations = {}
+            for problem_context in problem_contexts:
+                problem_id = problem_context["problem_id"]
+                entry = data.get(problem_id)
+                if not isinstance(entry, dict):
+                    continue
+
+                recommended_id = entry.get("recommended_option_id")
+                reason = entry.get("reason")
+
+                # Validate recommended_id exists in this problem's options
+                option_ids = {opt.option_id for opt in options_per_problem.get(problem_id, [])}
+                if not isinstance(recommended_id, str) or recommended_id not in option_ids or not reason:
+                    print(f"[WARNING] GPT recommended invalid option_id for {problem_id}: {recommended_id}")
+                    continue
+
+                recommendations[problem_id] = (recommended_id, reason)
+
+            if recommendations and complete:
+                self._cache_response(cache_key, content)
+            return recommendations
 
         except Exception as e:
-            # Fail silently - return None, None
-            print(f"[WARNING] Failed to generate GPT recommendation: {type(e).__name__}: {str(e)}")
-            return None, None
\ No newline at end of file
+            # Fail silently - problems fall back to per-problem recommendations
+            print(f"[WARNING] Failed to generate bulk GPT recommendations: {type(e).__name__}: {str(e)}")
+            return {}
+
+    async def generate_recommendations_concurrent(
+        self,
+        problems: List[Problem],
+        options_per_problem: Dict[str, List[CleaningOption]],
+        dataset_stats: DatasetStats,
+        dataset_name: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate GPT recommendations for several problems with one request per problem, run concurrently.
+
+        Args:
+            problems: Problems to recommend for
+            options_per_problem: Mapping of problem_id to that problem's options
+            dataset_stats: Current dataset statistics (row count, column count)
+            dataset_name: Name of the dataset for context
+
+        Returns:
+            Mapping of problem_id to (recommended_option_id, reason). Failed or
+            invalid recommendations are left out.
+        """
+        results = await asyncio.gather(*(
+            self.generate_recommendation(
+                problem, options_per_problem.get(problem.problem_id, []), dataset_stats, dataset_name
+            )
+            for problem in problems
+        ))
+
+        return {
+            problem.problem_id: (recommended_id, reason)
+            for problem, (recommended_id, reason) in zip(problems, results)
+            if recommended_id and reason
+        }
+
+    async def generate_recommendations_batch(
+        self,
+        problems: List[Problem],
+        options_per_problem: Dict[str, List[CleaningOption]],
+        dataset_stats: DatasetStats,
+        dataset_name: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Generate recommendations through the OpenAI Batch API.
+
+        Batch requests cost half as much and have separate rate limits, but may
+        take up to the completion window to finish, so this is only meant for
+        non-interactive (scripted) cleaning runs.
+
+        Args:
+            problems: Problems to recommend for
+            options_per_problem: Mapping of problem_id to that problem's options
+            dataset_stats: Current dataset statistics (row count, column count)
+            dataset_name: Name of the dataset for context
+
+        Returns:
+            Mapping of problem_id to (recommended_option_id, reason). Failed or
+            invalid lines are left out, and an empty dict is returned if the
+            batch itself fails.
+        """
+        try:
+            # One chat completion request per problem, keyed by problem_id
+            lines = []
+            for problem in problems:
+                options = options_per_problem.get(problem.problem_id, [])
+                prompt = self._recommendation_prompt(problem, options, dataset_stats, dataset_name)
+                lines.append(orjson.dumps({
+                    "custom_id": problem.problem_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": RECOMMENDATION_CONFIG.get("model", self.model),
+                        "messages": [{"role": "user", "content": prompt}],
+                        "temperature": RECOMMENDATION_CONFIG.get("temperature", 0.3),
+                        "max_completion_tokens": RECOMMENDATION_CONFIG.get("max_completion_tokens", 150)
+                    }
+                }))
+
+            if not lines:
+                return {}
+
+            batch_file = await self.client.files.create(
+                file=("recommendations.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=RECOMMENDATION_CONFIG.get("batch_completion_window", "24h")
+            )
+            print(f"[GPT] Submitted recommendation batch {batch.id} ({len(lines)} requests)")
+
+            # Poll until the batch reaches a terminal state
+            poll_interval = RECOMMENDATION_CONFIG.get("batch_poll_interval", 30)
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"[WARNING] Recommendation batch {batch.id} ended with status: {batch.status}")
+                return {}
+
+            output = await self.client.files.content(batch.output_file_id)
+
+            recommendations = {}
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                result = orjson.loads(line)
+                problem_id = result.get("custom_id")
+                response = result.get("response") or {}
+                if problem_id not in options_per_problem or response.get("status_code") != 200:
+                    continue
+
+                try:
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    recommended_id, reason = self._parse_recommendation_content(
+                        content, options_per_problem[problem_id]
+                    )
+                except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                    print(f"[WARNING] Could not parse batch result for {problem_id}: {e}")
+                    continue
+
+                if recommended_id and reason:
+                    recommendations[problem_id] = (recommended_id, reason)
+
+            return recommendations
+
+        except Exception as e:
+            # Fail silently - problems fall back to per-problem recommendations
+            print(f"[WARNING] Failed to generate batch GPT recommendations: {type(e).__name__}: {str(e)}")
+            return {}
@@ -4,7 +4,7 @@ Session state management for cleaning operations.
 
 import pandas as pd
 import uuid
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import os
 import pickle
@@ -16,11 +16,33 @@ from .models import (
     OperationRecord,
     DatasetStats
 )
-from .config import SESSION_CONFIG
+from .config import SESSION_CONFIG, CSV_READ_OPTIONS
 from .operations import execute_operation
 from .detection import detect_all_problems
 
 
+def read_dataset_csv(
+    temp_file_path: str,
+    dtype: Optional[Dict[str, Any]] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a session dataset CSV with the configured parser options.
+
+    Args:
+        temp_file_path: Path to the CSV file
+        dtype: Optional column -> dtype mapping to skip inference for known columns
+        columns: Optional list of columns to load (others are never parsed)
+
+    Returns:
+        Parsed DataFrame
+
+    Raises:
+        ValueError: If a requested column is not in the file
+    """
+    return pd.read_csv(temp_file_path, dtype=dtype, usecols=columns, **CSV_READ_OPTIONS)
+
+
 class SessionData:
     """Internal session data storage"""
 
@@ -38,43 +60,66 @@ class SessionData:
         # Cache for current problem's options (to maintain consistent option_ids)
         self.cached_options: Optional[List] = None
         self.cached_recommendation = None
-        # Cache recommendations per problem_id (preserved across operations)
+        # Cache recommendations per problem_id as (options fingerprint, recommendation),
+        # preserved across operations and discarded when the problem's options change
         self.recommendation_cache: Dict[str, any] = {}
+        # In-flight background recommendation tasks per problem_id
+        self.pending_recommendations: Dict[str, "asyncio.Task"] = {}
+        # Last ProblemWithOptions returned by get_next_problem (used to look up the applied option)
+        self.last_served = None
+        # Stats for the DataFrame object they were computed from (see get_current_stats)
+        self._stats: Optional[DatasetStats] = None
+        self._stats_df: Optional[pd.DataFrame] = None
 
     def get_current_stats(self) -> DatasetStats:
-        """Get current dataset statistics"""
+        """
+        Get current dataset statistics.
+
+        Operations always replace self.df with a new DataFrame, so the stats are
+        computed once per DataFrame version (e.g. the stats after one operation
+        are reused as the stats before the next).
+        """
+        if self._stats is not None and self._stats_df is self.df:
+            return self._stats
+
         missing_count = self.df.isna().sum().sum()
         duplicate_count = self.df.duplicated().sum()
 
-        # Count outliers (simple check on numeric columns)
-        outlier_count = 0
-        for column in self.df.select_dtypes(include=['number']).columns:
-            values = self.df[column].dropna()
-            if len(values) >= 4:
-                Q1 = values.quantile(0.25)
-                Q3 = values.quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                outlier_count += ((self.df[column] < lower_bound) | (self.df[column] > upper_bound)).sum()
-
-        return DatasetStats(
+        # Count outliers (simple IQR check on numeric columns with 4+ values)
+        numeric = self.df.select_dtypes(include=['number'])
+        numeric = numeric.loc[:, numeric.count() >= 4]
+        Q1 = numeric.quantile(0.25)
+        Q3 = numeric.quantile(0.75)
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        outlier_count = (numeric.lt(lower_bound) | numeric.gt(upper_bound)).to_numpy().sum()
+
+        self._stats = DatasetStats(
             row_count=len(self.df),
             column_count=len(self.df.columns),
             missing_value_count=int(missing_count),
             duplicate_row_count=int(duplicate_count),
             outlier_count=int(outlier_count)
         )
+        self._stats_df = self.df
+        return self._stats
 
     def to_session_state(self) -> SessionState:
-        """Convert to SessionState model"""
-        return SessionState(
+        """
+        Convert to SessionState model.
+
+        Every field is already a validated model or plain value owned by this
+        session, so model_construct skips re-validating the problems and
+        operation history on each request.
+        """
+        return SessionState.model_construct(
             session_id=self.session_id,
             temp_file_path=self.temp_file_path,
             dataset_name=self.dataset_name,
-            problems=self.problems,
+            problems=list(self.problems),
             current_problem_index=self.current_problem_index,
-            operation_history=self.operation_history,
+            operation_history=list(self.operation_history),
             current_stats=self.get_current_stats(),
             created_at=self.created_at,
             updated_at=self.updated_at
@@ -89,7 +134,13 @@ class SessionManager:
         self._backup_dir = Path("./backups/cleaning_sessions")
         self._backup_dir.mkdir(parents=True, exist_ok=True)
 
-    def create_session(self, temp_file_path: str, dataset_name: str, problems: List[Problem]) -> str:
+    def create_session(
+        self,
+        temp_file_path: str,
+        dataset_name: str,
+        problems: List[Problem],
+        df: Optional[pd.DataFrame] = None
+    ) -> str:
         """
         Create a new cleaning session.
 
@@ -97,12 +148,14 @@ class SessionManager:
             temp_file_path: Path to the temporary CSV file
             dataset_name: Name of the dataset
             problems: List of detected problems
+            df: Already-parsed DataFrame for temp_file_path (read from the file if omitted)
 
         Returns:
             Session ID
         """
         # Load DataFrame
-        df = pd.read_csv(temp_file_path)
+        if df is None:
+            df = read_dataset_csv(temp_file_path)
 
         # Generate session ID
         session_id = str(uuid.uuid4())
@@ -15,7 +15,7 @@ from .openai_client import TextToSQLOpenAIClient
 from .state_manager import session_manager, build_schema_context
 from .config import SQL_CONFIG, VALIDATION_CONFIG
 from .sql_validator import SQLValidator, ValidationResult
-from ..chart_rec_agent import chart_rec_agent
+from ..chart_rec_agent import get_chart_rec_agent
 
 from database.db_utils import get_dataset, query_dataset
 
@@ -155,7 +155,7 @@ class TextToSQLAgent:
             columns_info.append({"name": col_name, "type": col_type})
 
         # Re-run chart recommendations with preferred type
-        viz_response = chart_rec_agent.get_recommendations(
+        viz_response = get_chart_rec_agent().get_recommendations(
             user_question=f"Show as {chart_type} chart",
             sql_query=last_sql,
             columns_info=columns_info,
@@ -418,7 +418,7 @@ class TextToSQLAgent:
         if last_user_msg:
             user_question_with_context = f"Context: {last_user_msg}\nCurrent Request: {message}"
 
-        viz_response = chart_rec_agent.get_recommendations(
+        viz_response = get_chart_rec_agent().get_recommendations(
             user_question=user_question_with_context,
             sql_query=sql_query,
             columns_info=columns_info,
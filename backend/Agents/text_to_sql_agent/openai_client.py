@@ -2,13 +2,14 @@
 OpenAI API client for SQL generation.
 """
 
-from openai import OpenAI, RateLimitError
+from openai import RateLimitError
 import json
 import time
 import re
 import os
 from typing import Optional, List, Dict, Any
 
+from .._openai_shared import get_openai_client
 from .models import SchemaContext, Message, GPTSQLResponse
 from .prompts import build_system_prompt, build_user_prompt, FOLLOW_UP_SUGGESTIONS_PROMPT
 from .config import OPENAI_CONFIG, RATE_LIMIT_CONFIG
@@ -29,7 +30,7 @@ class TextToSQLOpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = OPENAI_CONFIG["model"]
 
     def _parse_retry_after(self, error_message: str) -> float:
@@ -64,6 +64,7 @@ class SessionManager:
         # Store user_id and dataset_id for later conversation creation
         session._user_id = user_id
         session._conversation_created = False  # Track if conversation exists in DB
+        session._write_lock = Lock()  # Orders this session's message writes (memory and DB)
 
         with self._lock:
             self._sessions[session_id] = session
@@ -137,25 +138,40 @@ class SessionManager:
         Returns:
             True if message was added
         """
+        message = Message(
+            role=role,
+            content=content,
+            sql_query=sql_query,
+            visualization_recommendations=visualization_recommendations
+        )
+
         with self._lock:
             session = self._sessions.get(session_id)
-            if session is None:
-                return False
+        if session is None:
+            return False
 
-            message = Message(
-                role=role,
-                content=content,
-                sql_query=sql_query,
-                visualization_recommendations=visualization_recommendations
-            )
-            session.messages.append(message)
+        # Writes to one session are serialized by its own lock, so the conversation
+        # row exists before any message insert and the DB keeps the in-memory order.
+        # Other sessions only wait on the manager lock, which is held just long
+        # enough to publish a new messages list (copy-on-write) for lock-free readers.
+        with session._write_lock:
+            with self._lock:
+                messages = [*session.messages, message]
+                is_first_message = len(messages) == 1
+
+                # Trim messages if exceeding limit
+                max_messages = SESSION_CONFIG["max_messages_per_session"]
+                if len(messages) > max_messages:
+                    messages = messages[-max_messages:]
+
+                session.messages = messages
+                session.last_activity = datetime.now()
 
             # Persist message to database
             user_id = getattr(session, '_user_id', None)
             if user_id:
                 # Create conversation in database on first message (lazy creation)
-                conversation_created = getattr(session, '_conversation_created', False)
-                if not conversation_created:
+                if not session._conversation_created:
                     # Use existing session_id as conversation_id
                     db_session_id = create_conversation(user_id, session.dataset_id, conversation_id=session_id)
                     if db_session_id:
@@ -173,17 +189,11 @@ class SessionManager:
                     visualization_config=visualization_recommendations
                 )
                 # Set conversation title from first user message
-                if role == "user" and len(session.messages) == 1:
+                if role == "user" and is_first_message:
                     title = content[:100] + "..." if len(content) > 100 else content
                     update_conversation_title(session_id, title)
 
-            # Trim messages if exceeding limit
-            max_messages = SESSION_CONFIG["max_messages_per_session"]
-            if len(session.messages) > max_messages:
-                session.messages = session.messages[-max_messages:]
-
-            session.last_activity = datetime.now()
-            return True
+        return True
 
     def get_messages(self, session_id: str) -> List[Message]:
         """
@@ -195,11 +205,11 @@ class SessionManager:
         Returns:
             List of messages or empty list
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session:
-                return session.messages.copy()
-            return []
+        # Lock-free: add_message never mutates a published messages list
+        session = self._sessions.get(session_id)
+        if session:
+            return list(session.messages)
+        return []
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -303,6 +313,7 @@ class SessionManager:
         # Store user_id for persistence and mark as already in DB
         session._user_id = user_id
         session._conversation_created = True  # Already exists in database
+        session._write_lock = Lock()  # Orders this session's message writes (memory and DB)
 
         with self._lock:
             self._sessions[session_id] = session
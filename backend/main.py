@@ -164,6 +164,13 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Close shared OpenAI connection pools
+    try:
+        from Agents._openai_shared import close_openai_clients
+        await close_openai_clients()
+    except Exception as e:
+        print(f"[WARNING] Failed to close OpenAI clients: {e}")
+
 app = FastAPI(
     title="Natural Language Data Visualization API",
     description="API for uploading datasets and querying them with natural language",
@@ -64,9 +64,10 @@ async def start_cleaning_session(
             )
 
         # Start cleaning session
-        response = cleaning_agent.start_session(
+        response = await cleaning_agent.start_session(
             temp_file_path=temp_file_path,
-            dataset_name=request.dataset_name
+            dataset_name=request.dataset_name,
+            columns=request.columns
         )
 
         return response
@@ -115,7 +116,7 @@ async def apply_cleaning_operation(
     """
     try:
         # Apply operation
-        result = cleaning_agent.apply_operation(
+        result = await cleaning_agent.apply_operation(
             session_id=request.session_id,
             option_id=request.option_id,
             custom_parameters=request.custom_parameters
@@ -161,7 +162,7 @@ async def confirm_cleaning_operation(
         OperationResult with next problem (including GPT recommendation) and session_complete status
     """
     try:
-        result = cleaning_agent.confirm_and_advance(session_id=request.session_id)
+        result = await cleaning_agent.confirm_and_advance(session_id=request.session_id)
         return result
 
     except ValueError as e:
@@ -201,7 +202,7 @@ async def undo_last_operation(
         OperationResult with restored stats
     """
     try:
-        result = cleaning_agent.undo_last(session_id=request.session_id)
+        result = await cleaning_agent.undo_last(session_id=request.session_id)
         return result
 
     except ValueError as e:
@@ -270,7 +271,7 @@ async def get_current_recommendation(
         ProblemWithOptions with recommendation, or null if no current problem
     """
     try:
-        result = cleaning_agent.get_current_recommendation(session_id=session_id)
+        result = await cleaning_agent.get_current_recommendation(session_id=session_id)
         return result
 
     except ValueError as e: